@@ -1,3 +1,4 @@
+import { lazy, Suspense } from "react";
 import { Toaster } from "@/components/ui/sonner";
 import { TooltipProvider } from "@/components/ui/tooltip";
 import NotFound from "@/pages/NotFound";
@@ -14,14 +15,25 @@ import WrongQuestions from "./pages/WrongQuestions";
 import Review from "./pages/Review";
 import Notes from "./pages/Notes";
 import Achievements from "./pages/Achievements";
-import KnowledgeGraph from "./pages/KnowledgeGraph";
-import Report from "./pages/Report";
-import Leaderboard from "./pages/Leaderboard";
-import Insights from "./pages/Insights";
 import Settings from "./pages/Settings";
-import AlgorithmDemo from "./pages/AlgorithmDemo";
 import { initializeDemoData } from "./lib/demo-data";
 
+// Analytics pages are split into their own chunks and fetched on first visit,
+// keeping them (and the bundled simulation results) off the initial load.
+const KnowledgeGraph = lazy(() => import("./pages/KnowledgeGraph"));
+const Report = lazy(() => import("./pages/Report"));
+const Leaderboard = lazy(() => import("./pages/Leaderboard"));
+const Insights = lazy(() => import("./pages/Insights"));
+const AlgorithmDemo = lazy(() => import("./pages/AlgorithmDemo"));
+
+function PageFallback() {
+  return (
+    <div className="flex items-center justify-center h-[60vh]">
+      <div className="w-12 h-12 border-3 border-blue-500/30 border-t-blue-500 rounded-full animate-spin" />
+    </div>
+  );
+}
+
 // Initialize demo accounts on first load
 initializeDemoData();
 
@@ -42,27 +54,29 @@ function AppRoutes() {
 
   return (
     <AppLayout>
-      <Switch>
-        <Route path="/login">
-          <Redirect to="/dashboard" />
-        </Route>
-        <Route path="/dashboard" component={Dashboard} />
-        <Route path="/learn" component={Learn} />
-        <Route path="/challenge" component={Challenge} />
-        <Route path="/wrong-questions" component={WrongQuestions} />
-        <Route path="/review" component={Review} />
-        <Route path="/notes" component={Notes} />
-        <Route path="/achievements" component={Achievements} />
-        <Route path="/knowledge-graph" component={KnowledgeGraph} />
-        <Route path="/report" component={Report} />
-        <Route path="/leaderboard" component={Leaderboard} />
-        <Route path="/insights" component={Insights} />
-        <Route path="/settings" component={Settings} />
-        <Route path="/algorithm" component={AlgorithmDemo} />
-        <Route path="/" component={Dashboard} />
-        <Route path="/404" component={NotFound} />
-        <Route component={NotFound} />
-      </Switch>
+      <Suspense fallback={<PageFallback />}>
+        <Switch>
+          <Route path="/login">
+            <Redirect to="/dashboard" />
+          </Route>
+          <Route path="/dashboard" component={Dashboard} />
+          <Route path="/learn" component={Learn} />
+          <Route path="/challenge" component={Challenge} />
+          <Route path="/wrong-questions" component={WrongQuestions} />
+          <Route path="/review" component={Review} />
+          <Route path="/notes" component={Notes} />
+          <Route path="/achievements" component={Achievements} />
+          <Route path="/knowledge-graph" component={KnowledgeGraph} />
+          <Route path="/report" component={Report} />
+          <Route path="/leaderboard" component={Leaderboard} />
+          <Route path="/insights" component={Insights} />
+          <Route path="/settings" component={Settings} />
+          <Route path="/algorithm" component={AlgorithmDemo} />
+          <Route path="/" component={Dashboard} />
+          <Route path="/404" component={NotFound} />
+          <Route component={NotFound} />
+        </Switch>
+      </Suspense>
     </AppLayout>
   );
 }
@@ -85,7 +85,9 @@ export default function AppLayout({ children }: { children: ReactNode }) {
     setExpandedGroups(prev => ({ ...prev, [label]: !prev[label] }));
   };
 
-  const SidebarContent = () => (
+  // A plain element rather than a nested component: a component declared in
+  // here would get a new identity each render and remount the whole sidebar.
+  const sidebarContent = (
     <div className="flex flex-col h-full">
       {/* Logo - compact */}
       <div className="px-3 py-2.5 flex items-center gap-2.5 shrink-0">
@@ -261,7 +263,7 @@ export default function AppLayout({ children }: { children: ReactNode }) {
         transition={{ duration: 0.3, ease: 'easeInOut' }}
         className="hidden lg:flex flex-col glass-sidebar shrink-0 overflow-hidden"
       >
-        <SidebarContent />
+        {sidebarContent}
       </motion.aside>
 
       {/* Mobile Header */}
@@ -300,7 +302,7 @@ export default function AppLayout({ children }: { children: ReactNode }) {
                   <X size={16} />
                 </button>
               </div>
-              <SidebarContent />
+              {sidebarContent}
             </motion.aside>
           </>
         )}
@@ -17,6 +17,13 @@ function linspace(start: number, end: number, n: number): number[] {
 
 export const ABILITY_GRID = linspace(ABILITY_MIN, ABILITY_MAX, GRID_SIZE);
 
+// Logistic function, evaluated so that exp() never overflows
+function sigmoid(z: number): number {
+  if (z >= 0) return 1 / (1 + Math.exp(-z));
+  const expZ = Math.exp(z);
+  return expZ / (1 + expZ);
+}
+
 // 4PL IRT model
 function irt4pl(
   ability: number,
@@ -26,8 +33,22 @@ function irt4pl(
   slipping: number = 0.05
 ): number {
   const z = discrimination * (ability - difficulty);
-  const expZ = Math.exp(z);
-  return guessing + (1 - guessing - slipping) * (expZ / (1 + expZ));
+  return guessing + (1 - guessing - slipping) * sigmoid(z);
+}
+
+// P(correct) across the ability grid for a given difficulty.
+// The grid is fixed and the question bank has a small set of difficulties,
+// so rows are computed once and reused for every update and EIG evaluation.
+// Rows are packed Float64Arrays since they never leave the engine.
+const likelihoodCache = new Map<number, Float64Array>();
+
+function likelihoodRow(difficulty: number): Float64Array {
+  let row = likelihoodCache.get(difficulty);
+  if (!row) {
+    row = Float64Array.from(ABILITY_GRID, a => irt4pl(a, difficulty));
+    likelihoodCache.set(difficulty, row);
+  }
+  return row;
 }
 
 // Entropy of a distribution
@@ -39,27 +60,31 @@ function entropy(dist: number[]): number {
   return h;
 }
 
-// Normalize distribution
-function normalize(dist: number[]): number[] {
-  const sum = dist.reduce((a, b) => a + b, 0);
-  if (sum < 1e-10) return dist.map(() => 1 / dist.length);
-  return dist.map(v => v / sum);
+// Every learner starts from the same uniform prior, so the prior, its entropy
+// and the EIG of each difficulty under it are computed once and shared.
+// UNIFORM_PRIOR is never handed out directly; brain states get a copy.
+const UNIFORM_PRIOR: number[] = Array(GRID_SIZE).fill(1 / GRID_SIZE);
+const UNIFORM_ENTROPY = entropy(UNIFORM_PRIOR);
+const uniformPriorEIG = new Map<number, number>();
+
+function isUniformPrior(belief: number[]): boolean {
+  for (let i = 0; i < GRID_SIZE; i++) {
+    if (belief[i] !== UNIFORM_PRIOR[i]) return false;
+  }
+  return true;
 }
 
 export interface BrainState {
   belief: number[];
   estimatedAbility: number;
   uncertainty: number;
-  history: { questionId: number; correct: boolean; ability: number }[];
 }
 
 export function createInitialBrainState(): BrainState {
-  const uniform = Array(GRID_SIZE).fill(1 / GRID_SIZE);
   return {
-    belief: uniform,
+    belief: [...UNIFORM_PRIOR],
     estimatedAbility: 0.5,
-    uncertainty: entropy(uniform),
-    history: [],
+    uncertainty: UNIFORM_ENTROPY,
   };
 }
 
@@ -69,65 +94,99 @@ export function updateBelief(
   question: Question,
   correct: boolean
 ): BrainState {
-  const newBelief = [...state.belief];
+  const pCorrectRow = likelihoodRow(question.difficulty);
+  // Written by index into a fixed-size array rather than copying the prior
+  // first and scaling the copy in place. Pre-filled so V8 keeps it packed, and
+  // a plain array rather than a Float64Array since the belief is persisted.
+  const newBelief: number[] = new Array(GRID_SIZE).fill(0);
+  let total = 0;
   for (let i = 0; i < GRID_SIZE; i++) {
-    const pCorrect = irt4pl(ABILITY_GRID[i], question.difficulty);
+    const pCorrect = pCorrectRow[i];
     const likelihood = correct ? pCorrect : 1 - pCorrect;
-    newBelief[i] *= likelihood;
+    newBelief[i] = state.belief[i] * likelihood;
+    total += newBelief[i];
   }
-  const normalizedBelief = normalize(newBelief);
 
-  // Compute estimated ability (expected value)
+  // Normalize, accumulating estimated ability (expected value) and entropy in the same pass
   let estimatedAbility = 0;
+  let uncertainty = 0;
   for (let i = 0; i < GRID_SIZE; i++) {
-    estimatedAbility += ABILITY_GRID[i] * normalizedBelief[i];
+    const p = total < 1e-10 ? 1 / GRID_SIZE : newBelief[i] / total;
+    newBelief[i] = p;
+    estimatedAbility += ABILITY_GRID[i] * p;
+    if (p > 1e-10) uncertainty -= p * Math.log2(p);
   }
 
-  const newHistory = [
-    ...state.history,
-    { questionId: question.id, correct, ability: estimatedAbility },
-  ];
-
+  // No per-answer trail is kept on the state: nothing reads it, and the
+  // profile's sessionHistory already records abilityAfter/entropyAfter
   return {
-    belief: normalizedBelief,
+    belief: newBelief,
     estimatedAbility,
-    uncertainty: entropy(normalizedBelief),
-    history: newHistory,
+    uncertainty,
   };
 }
 
-// Expected Information Gain for a question
-export function expectedInformationGain(
-  belief: number[],
-  question: Question
-): number {
-  const priorEntropy = entropy(belief);
-  let expectedPosteriorEntropy = 0;
+// Expected entropy of the posterior after answering a question of the given difficulty.
+// Scalar loops only: the posteriors are normalized on the fly instead of being
+// materialized, since this runs once per candidate on every question selection.
+function expectedPosteriorEntropy(belief: number[], difficulty: number): number {
+  const pCorrectRow = likelihoodRow(difficulty);
 
-  // P(correct) marginalized over ability
+  // P(correct) / P(wrong) marginalized over ability.
+  // The unnormalized wrong posterior b * (1 - p) is just b - b * p.
   let pCorrectMarginal = 0;
+  let pWrongMarginal = 0;
   for (let i = 0; i < GRID_SIZE; i++) {
-    pCorrectMarginal += irt4pl(ABILITY_GRID[i], question.difficulty) * belief[i];
+    const joint = belief[i] * pCorrectRow[i];
+    pCorrectMarginal += joint;
+    pWrongMarginal += belief[i] - joint;
   }
-  const pWrongMarginal = 1 - pCorrectMarginal;
 
-  // Posterior if correct
-  const beliefIfCorrect = belief.map(
-    (b, i) => b * irt4pl(ABILITY_GRID[i], question.difficulty)
-  );
-  const normCorrect = normalize(beliefIfCorrect);
+  // Entropy of the posterior if correct / if wrong
+  let hCorrect = 0;
+  let hWrong = 0;
+  for (let i = 0; i < GRID_SIZE; i++) {
+    const joint = belief[i] * pCorrectRow[i];
+    const postCorrect = joint / pCorrectMarginal;
+    const postWrong = (belief[i] - joint) / pWrongMarginal;
+    if (postCorrect > 1e-10) hCorrect -= postCorrect * Math.log2(postCorrect);
+    if (postWrong > 1e-10) hWrong -= postWrong * Math.log2(postWrong);
+  }
+  // Degenerate posteriors fall back to uniform, as in updateBelief()
+  if (pCorrectMarginal < 1e-10) hCorrect = Math.log2(GRID_SIZE);
+  if (pWrongMarginal < 1e-10) hWrong = Math.log2(GRID_SIZE);
 
-  // Posterior if wrong
-  const beliefIfWrong = belief.map(
-    (b, i) => b * (1 - irt4pl(ABILITY_GRID[i], question.difficulty))
-  );
-  const normWrong = normalize(beliefIfWrong);
+  return pCorrectMarginal * hCorrect + (1 - pCorrectMarginal) * hWrong;
+}
 
-  expectedPosteriorEntropy =
-    pCorrectMarginal * entropy(normCorrect) +
-    pWrongMarginal * entropy(normWrong);
+// Expected Information Gain for a question
+export function expectedInformationGain(
+  belief: number[],
+  question: Question
+): number {
+  return entropy(belief) - expectedPosteriorEntropy(belief, question.difficulty);
+}
 
-  return priorEntropy - expectedPosteriorEntropy;
+// Expected Information Gain for a batch of candidate questions.
+// EIG only depends on difficulty, so each distinct difficulty is scored once
+// and the prior entropy is shared across all candidates. Scores under the
+// initial uniform prior are kept across calls, since every new learner's
+// first selection asks for exactly those.
+export function expectedInformationGains(
+  belief: number[],
+  candidates: Question[]
+): number[] {
+  const fromPrior = isUniformPrior(belief);
+  const priorEntropy = fromPrior ? UNIFORM_ENTROPY : entropy(belief);
+  const byDifficulty = fromPrior ? uniformPriorEIG : new Map<number, number>();
+  return candidates.map(q => {
+    let eig = byDifficulty.get(q.difficulty);
+    if (eig === undefined) {
+      eig = priorEntropy - expectedPosteriorEntropy(belief, q.difficulty);
+      byDifficulty.set(q.difficulty, eig);
+    }
+    return eig;
+  });
 }
 
 // Select next question using Active Inference (max EIG)
@@ -137,18 +196,13 @@ export function selectNextQuestion(
 ): Question | null {
   if (availableQuestions.length === 0) return null;
 
-  let bestQuestion = availableQuestions[0];
-  let bestEIG = -Infinity;
-
-  for (const q of availableQuestions) {
-    const eig = expectedInformationGain(state.belief, q);
-    if (eig > bestEIG) {
-      bestEIG = eig;
-      bestQuestion = q;
-    }
+  const eigs = expectedInformationGains(state.belief, availableQuestions);
+  let best = 0;
+  for (let i = 1; i < eigs.length; i++) {
+    if (eigs[i] > eigs[best]) best = i;
   }
 
-  return bestQuestion;
+  return availableQuestions[best];
 }
 
 // Get ability grid for visualization
@@ -163,12 +217,17 @@ export function getConceptMastery(
 ): Record<string, { total: number; correct: number; accuracy: number }> {
   const mastery: Record<string, { total: number; correct: number; accuracy: number }> = {};
 
+  // Resolve each question's concept once instead of scanning the bank per entry
+  const conceptById = new Map<number, string>();
+  for (const q of allQuestions) conceptById.set(q.id, q.concept);
+
   for (const entry of history) {
-    const q = allQuestions.find(qq => qq.id === entry.questionId);
-    if (!q) continue;
-    if (!mastery[q.concept]) mastery[q.concept] = { total: 0, correct: 0, accuracy: 0 };
-    mastery[q.concept].total++;
-    if (entry.correct) mastery[q.concept].correct++;
+    const concept = conceptById.get(entry.questionId);
+    if (concept === undefined) continue;
+    let conceptMastery = mastery[concept];
+    if (!conceptMastery) conceptMastery = mastery[concept] = { total: 0, correct: 0, accuracy: 0 };
+    conceptMastery.total++;
+    if (entry.correct) conceptMastery.correct++;
   }
 
   for (const key of Object.keys(mastery)) {
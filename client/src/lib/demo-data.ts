@@ -2,9 +2,9 @@
 // Creates pre-populated demo accounts with realistic learning records
 // for thesis presentation purposes
 
-import { ACHIEVEMENT_DEFS, LEVELS, getLevelInfo } from './store';
-import { CONCEPTS, questions as QUESTIONS, Question } from './questions';
-import { createInitialBrainState, updateBelief, selectNextQuestion, ABILITY_GRID } from './adaptive-engine';
+import { ACHIEVEMENT_DEFS, getLevelInfo } from './store';
+import { CONCEPTS, questions as QUESTIONS, getQuestionById, getQuestionsByConceptMap } from './questions';
+import { createInitialBrainState, updateBelief, selectNextQuestion } from './adaptive-engine';
 
 const STORAGE_KEY = 'adaptive_learning_users';
 const PASSWORDS_KEY = 'adaptive_learning_passwords';
@@ -31,18 +31,23 @@ function simulateSession(
 ) {
   let brain = createInitialBrainState();
   const history: any[] = [];
-  const answeredIds: number[] = [];
+  const answeredIds = new Set<number>();
   let fixedIdx = 0;
 
+  // Read-only below, so the bank and its concept groups are used as is
   const availableQuestions = conceptFocus
-    ? QUESTIONS.filter((q: Question) => q.concept === conceptFocus)
-    : [...QUESTIONS];
+    ? getQuestionsByConceptMap()[conceptFocus] ?? []
+    : QUESTIONS;
+  // Unanswered candidates, kept in bank order and shrunk as questions are
+  // used instead of re-filtering the whole pool on every step
+  const unanswered = availableQuestions.slice();
 
   for (let i = 0; i < numQuestions; i++) {
     let question;
     if (mode === 'adaptive') {
-      const unanswered = availableQuestions.filter((q: any) => !answeredIds.includes(q.id));
       question = selectNextQuestion(brain, unanswered.length > 0 ? unanswered : availableQuestions);
+      const idx = question ? unanswered.indexOf(question) : -1;
+      if (idx !== -1) unanswered.splice(idx, 1);
     } else {
       question = availableQuestions[fixedIdx % availableQuestions.length];
       fixedIdx++;
@@ -56,11 +61,7 @@ function simulateSession(
 
     // Update brain state
     brain = updateBelief(brain, question, correct);
-    answeredIds.push(question.id);
-
-    // Calculate entropy
-    const entropy = brain.belief.reduce((s: number, p: number) =>
-      s - (p > 0 ? p * Math.log2(p) : 0), 0);
+    answeredIds.add(question.id);
 
     // Simulate time (harder questions take longer)
     const baseTime = 8 + question.difficulty * 25;
@@ -77,11 +78,11 @@ function simulateSession(
       timeSpent: Math.max(3, timeSpent),
       mode,
       abilityAfter: brain.estimatedAbility,
-      entropyAfter: entropy,
+      entropyAfter: brain.uncertainty,
     });
   }
 
-  return { history, brain, answeredIds };
+  return { history, brain, answeredIds: Array.from(answeredIds) };
 }
 
 function createDemoProfile(
@@ -104,14 +105,18 @@ function createDemoProfile(
   let allHistory: any[] = [];
   let allAnsweredIds: number[] = [];
   let finalBrain = createInitialBrainState();
+  // Running count of adaptive answers so far, rather than rescanning the
+  // accumulated history each day
+  let adaptiveSoFar = 0;
 
   for (let d = 0; d < config.daysActive; d++) {
     const dayStart = new Date(startDate.getTime() + d * 86400000 + 9 * 3600000 + Math.random() * 7200000);
-    const questionsToday = Math.min(adaptivePerDay, config.totalAdaptive - allHistory.filter(h => h.mode === 'adaptive').length);
+    const questionsToday = Math.min(adaptivePerDay, config.totalAdaptive - adaptiveSoFar);
     if (questionsToday <= 0) break;
 
     const session = simulateSession(config.trueAbility, 'adaptive', questionsToday, dayStart);
     allHistory.push(...session.history);
+    adaptiveSoFar += session.history.length;
     allAnsweredIds.push(...session.answeredIds);
     finalBrain = session.brain;
   }
@@ -124,41 +129,38 @@ function createDemoProfile(
     allAnsweredIds.push(...fixedSession.answeredIds);
   }
 
-  // Sort by timestamp
-  allHistory.sort((a, b) => new Date(a.timestamp).getTime() - new Date(b.timestamp).getTime());
+  // Sort by timestamp. Every entry comes from toISOString(), so the strings
+  // order chronologically as they are, with no Date parsing per comparison.
+  allHistory.sort((a, b) => (a.timestamp < b.timestamp ? -1 : a.timestamp > b.timestamp ? 1 : 0));
 
-  // Calculate stats
+  // Calculate stats: totals, per-concept counts and streaks in one pass
   const totalQ = allHistory.length;
-  const correctQ = allHistory.filter(h => h.correct).length;
-  const wrongQ = totalQ - correctQ;
-  const accuracy = totalQ > 0 ? Math.round((correctQ / totalQ) * 100) : 0;
-
-  // Concept stats
+  let correctQ = 0;
   const conceptStats: Record<string, { total: number; correct: number }> = {};
-  for (const h of allHistory) {
-    if (!conceptStats[h.concept]) conceptStats[h.concept] = { total: 0, correct: 0 };
-    conceptStats[h.concept].total++;
-    if (h.correct) conceptStats[h.concept].correct++;
-  }
-
-  // Best streak
   let currentStreak = 0;
   let bestStreak = 0;
   for (const h of allHistory) {
+    let conceptStat = conceptStats[h.concept];
+    if (!conceptStat) conceptStat = conceptStats[h.concept] = { total: 0, correct: 0 };
+    conceptStat.total++;
     if (h.correct) {
+      correctQ++;
+      conceptStat.correct++;
       currentStreak++;
       if (currentStreak > bestStreak) bestStreak = currentStreak;
     } else {
       currentStreak = 0;
     }
   }
+  const wrongQ = totalQ - correctQ;
+  const accuracy = totalQ > 0 ? Math.round((correctQ / totalQ) * 100) : 0;
 
   // Wrong questions
   const wrongQuestions: any[] = [];
   const wrongMap: Record<number, any> = {};
   for (const h of allHistory) {
     if (!h.correct) {
-      const q = QUESTIONS.find((qq: any) => qq.id === h.questionId);
+      const q = getQuestionById(h.questionId);
       if (!q) continue;
       if (wrongMap[h.questionId]) {
         wrongMap[h.questionId].wrongCount++;
@@ -361,11 +363,9 @@ function createDemoProfile(
   }
 
   // Also add some correctly-answered questions to spaced review (for variety)
-  const correctQuestionIds = allHistory
-    .filter(h => h.correct)
-    .map(h => h.questionId)
-    .filter((id, idx, arr) => arr.indexOf(id) === idx)
-    .slice(0, Math.max(0, config.reviewsDone - reviewableWrong.length));
+  const correctQuestionIds = Array.from(
+    new Set<number>(allHistory.filter(h => h.correct).map(h => h.questionId))
+  ).slice(0, Math.max(0, config.reviewsDone - reviewableWrong.length));
 
   for (const qid of correctQuestionIds) {
     if (spacedRepetition[String(qid)]) continue;
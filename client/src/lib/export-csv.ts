@@ -13,18 +13,27 @@ export function downloadCSV(filename: string, csvContent: string) {
   URL.revokeObjectURL(url);
 }
 
+// Characters that force a cell to be quoted, tested in one scan
+const CSV_NEEDS_QUOTING = /[,"\n]/;
+
+function escapeCSVCell(cell: string | number): string {
+  // Numbers never contain a delimiter, quote or newline
+  if (typeof cell === 'number') return String(cell);
+  const str = String(cell);
+  if (CSV_NEEDS_QUOTING.test(str)) {
+    return `"${str.replace(/"/g, '""')}"`;
+  }
+  return str;
+}
+
 export function arrayToCSV(headers: string[], rows: (string | number)[][]): string {
-  const headerLine = headers.join(',');
-  const dataLines = rows.map(row =>
-    row.map(cell => {
-      const str = String(cell);
-      if (str.includes(',') || str.includes('"') || str.includes('\n')) {
-        return `"${str.replace(/"/g, '""')}"`;
-      }
-      return str;
-    }).join(',')
-  );
-  return [headerLine, ...dataLines].join('\n');
+  // Append each line directly instead of collecting lines and copying them
+  // into a second array just to join it
+  let csv = headers.join(',');
+  for (const row of rows) {
+    csv += '\n' + row.map(escapeCSVCell).join(',');
+  }
+  return csv;
 }
 
 // Export learning history
@@ -55,7 +64,7 @@ export function exportAbilityTrajectory(username: string) {
   const profile = getUserProfile(username);
   if (!profile) return;
 
-  const headers = ['Step', 'Estimated Ability', 'Entropy', 'Cumulative Accuracy', 'Mode', 'Concept', 'Difficulty'];
+  const headers = ['Step', 'Estimated Ability', 'Entropy', 'Cumulative Accuracy %', 'Mode', 'Concept', 'Difficulty'];
   const rows: (string | number)[][] = [];
   let correct = 0;
 
@@ -65,7 +74,7 @@ export function exportAbilityTrajectory(username: string) {
       i + 1,
       h.abilityAfter !== undefined ? h.abilityAfter.toFixed(4) : '',
       h.entropyAfter !== undefined ? h.entropyAfter.toFixed(4) : '',
-      ((correct / (i + 1)) * 100).toFixed(1) + '%',
+      ((correct / (i + 1)) * 100).toFixed(1),
       h.mode || 'adaptive',
       h.concept,
       h.difficulty.toFixed(2)
@@ -150,15 +150,21 @@ export const questions: Question[] = [
 
 
 
+// The question bank is static, so the per-concept grouping is built once at load
+const questionsByConcept: Record<string, Question[]> = {};
+for (const q of questions) {
+  if (!questionsByConcept[q.concept]) questionsByConcept[q.concept] = [];
+  questionsByConcept[q.concept].push(q);
+}
+
 export function getQuestionsByConceptMap(): Record<string, Question[]> {
-  const map: Record<string, Question[]> = {};
-  for (const q of questions) {
-    if (!map[q.concept]) map[q.concept] = [];
-    map[q.concept].push(q);
-  }
-  return map;
+  return questionsByConcept;
 }
 
+// Likewise the id lookup, so getQuestionById() is a hash hit instead of a scan
+const questionsById = new Map<number, Question>();
+for (const q of questions) questionsById.set(q.id, q);
+
 export function getQuestionById(id: number): Question | undefined {
-  return questions.find(q => q.id === id);
+  return questionsById.get(id);
 }
@@ -117,6 +117,13 @@ export interface ChallengeResult {
   date: string;
 }
 
+export interface RecordAnswerOptions {
+  // Updated belief to persist in the same write as the answer
+  brainState?: BrainState;
+  // Queue a wrong answer for spaced review in the same write
+  queueReview?: boolean;
+}
+
 // ============ Achievement Definitions ============
 
 export const ACHIEVEMENT_DEFS: Omit<Achievement, 'unlockedAt' | 'progress'>[] = [
@@ -138,6 +145,8 @@ export const ACHIEVEMENT_DEFS: Omit<Achievement, 'unlockedAt' | 'progress'>[] =
   { id: 'challenge_complete', name: 'Challenger', description: 'Complete a timed challenge', icon: '⚡', category: 'special', target: 1 },
 ];
 
+const ACHIEVEMENT_DEFS_BY_ID = new Map(ACHIEVEMENT_DEFS.map(d => [d.id, d]));
+
 // ============ Level System ============
 
 export const LEVELS = [
@@ -185,15 +194,40 @@ const STORAGE_KEY = 'adaptive_learning_users';
 const CURRENT_USER_KEY = 'adaptive_learning_current_user';
 const CHALLENGE_HISTORY_KEY = 'adaptive_learning_challenges';
 
+// The parsed users blob, kept with the raw string it was parsed from.
+// Reads still fetch the raw string, so a write made elsewhere (demo data
+// setup, another tab) invalidates it, but an unchanged blob is not parsed
+// again on every access. Profiles in the cache are never handed out:
+// getUserProfile() returns a copy and saveUserProfile() stores one.
+let usersCache: { raw: string; users: Record<string, UserProfile> } | null = null;
+
 function getAllUsers(): Record<string, UserProfile> {
   try {
     const data = localStorage.getItem(STORAGE_KEY);
-    return data ? JSON.parse(data) : {};
+    if (!data) return {};
+    if (usersCache?.raw !== data) usersCache = { raw: data, users: JSON.parse(data) };
+    return usersCache.users;
   } catch { return {}; }
 }
 
 function saveAllUsers(users: Record<string, UserProfile>) {
-  localStorage.setItem(STORAGE_KEY, JSON.stringify(users));
+  const raw = JSON.stringify(users);
+  try {
+    localStorage.setItem(STORAGE_KEY, raw);
+  } catch (e) {
+    // setItem() either stores the whole string or throws (quota), so storage
+    // still holds the last good blob. Callers mutate the cached map before
+    // saving, so drop it and let the next read parse what is really stored.
+    usersCache = null;
+    throw e;
+  }
+  usersCache = { raw, users };
+}
+
+// Same result as re-reading the profile from storage, at the cost of one
+// profile rather than every stored user
+function cloneProfile(profile: UserProfile): UserProfile {
+  return JSON.parse(JSON.stringify(profile));
 }
 
 export function getCurrentUser(): string | null {
@@ -211,8 +245,10 @@ export function getUserProfile(username: string): UserProfile | null {
   if (profile) {
     // Migrate achievements: update names/descriptions from latest ACHIEVEMENT_DEFS
     let migrated = false;
+    const seen = new Set<string>();
     for (const ach of profile.achievements) {
-      const def = ACHIEVEMENT_DEFS.find(d => d.id === ach.id);
+      seen.add(ach.id);
+      const def = ACHIEVEMENT_DEFS_BY_ID.get(ach.id);
       if (def && (ach.name !== def.name || ach.description !== def.description)) {
         ach.name = def.name;
         ach.description = def.description;
@@ -222,7 +258,7 @@ export function getUserProfile(username: string): UserProfile | null {
     }
     // Add any new achievements that don't exist in old profile
     for (const def of ACHIEVEMENT_DEFS) {
-      if (!profile.achievements.find(a => a.id === def.id)) {
+      if (!seen.has(def.id)) {
         profile.achievements.push({ ...def, unlockedAt: null, progress: 0 });
         migrated = true;
       }
@@ -232,12 +268,12 @@ export function getUserProfile(username: string): UserProfile | null {
       saveAllUsers(users);
     }
   }
-  return profile;
+  return profile && cloneProfile(profile);
 }
 
 export function saveUserProfile(profile: UserProfile) {
   const users = getAllUsers();
-  users[profile.username] = profile;
+  users[profile.username] = cloneProfile(profile);
   saveAllUsers(users);
 }
 
@@ -321,11 +357,15 @@ export function recordAnswer(
   timeSpent: number,
   mode: 'adaptive' | 'fixed' = 'adaptive',
   abilityAfter?: number,
-  entropyAfter?: number
+  entropyAfter?: number,
+  { brainState, queueReview = false }: RecordAnswerOptions = {}
 ): { xpGained: number; newAchievements: Achievement[] } {
   const profile = getUserProfile(username);
   if (!profile) return { xpGained: 0, newAchievements: [] };
 
+  // Persist the updated belief with the answer so each answer is a single write
+  if (brainState) profile.brainState = brainState;
+
   const now = new Date().toISOString();
   const today = now.split('T')[0];
 
@@ -347,11 +387,10 @@ export function recordAnswer(
   profile.stats.totalStudyTime += timeSpent;
 
   // Update concept stats
-  if (!profile.stats.conceptStats[question.concept]) {
-    profile.stats.conceptStats[question.concept] = { total: 0, correct: 0 };
-  }
-  profile.stats.conceptStats[question.concept].total++;
-  if (correct) profile.stats.conceptStats[question.concept].correct++;
+  let conceptStat = profile.stats.conceptStats[question.concept];
+  if (!conceptStat) conceptStat = profile.stats.conceptStats[question.concept] = { total: 0, correct: 0 };
+  conceptStat.total++;
+  if (correct) conceptStat.correct++;
 
   // Add to session history
   profile.sessionHistory.push({
@@ -396,6 +435,8 @@ export function recordAnswer(
         reviewCount: 0,
       });
     }
+    // Queue for spaced review in the same write instead of a second addToReview()
+    if (queueReview) ensureReviewItem(profile, question.id, today);
   }
 
   // XP calculation
@@ -424,7 +465,7 @@ export function recordAnswer(
   profile.dailyProgress++;
 
   // Check achievements
-  const newAchievements = checkAchievements(profile);
+  const newAchievements = checkAchievements(profile, now);
 
   saveUserProfile(profile);
   return { xpGained, newAchievements };
@@ -432,9 +473,22 @@ export function recordAnswer(
 
 // ============ Achievement Checking ============
 
-function checkAchievements(profile: UserProfile): Achievement[] {
+// Unlock times reuse the answer's timestamp rather than formatting another
+function checkAchievements(profile: UserProfile, now: string): Achievement[] {
   const newlyUnlocked: Achievement[] = [];
-  const now = new Date().toISOString();
+
+  // Both review achievements count the same review histories; sum them at
+  // most once per check, and not at all once both are unlocked
+  let totalReviews: number | null = null;
+  const countReviews = () => {
+    if (totalReviews === null) {
+      totalReviews = 0;
+      for (const qid in profile.spacedRepetition) {
+        totalReviews += profile.spacedRepetition[qid].history.length;
+      }
+    }
+    return totalReviews;
+  };
 
   for (const ach of profile.achievements) {
     if (ach.unlockedAt) continue;
@@ -450,9 +504,11 @@ function checkAchievements(profile: UserProfile): Achievement[] {
       case 'accuracy_80': progress = Math.min(profile.stats.accuracy, 80); break;
       case 'accuracy_90': progress = Math.min(profile.stats.accuracy, 90); break;
       case 'all_concepts': {
-        const conceptsWithCorrect = Object.keys(profile.stats.conceptStats).filter(
-          c => profile.stats.conceptStats[c].correct > 0
-        ).length;
+        // Only the count is needed, so count rather than build a filtered key list
+        let conceptsWithCorrect = 0;
+        for (const c in profile.stats.conceptStats) {
+          if (profile.stats.conceptStats[c].correct > 0) conceptsWithCorrect++;
+        }
         progress = conceptsWithCorrect;
         break;
       }
@@ -467,20 +523,8 @@ function checkAchievements(profile: UserProfile): Achievement[] {
         progress = maxAcc;
         break;
       }
-      case 'first_review': {
-        const totalReviews = Object.values(profile.spacedRepetition).reduce(
-          (sum, item) => sum + item.history.length, 0
-        );
-        progress = Math.min(totalReviews, 1);
-        break;
-      }
-      case 'review_ten': {
-        const totalReviews = Object.values(profile.spacedRepetition).reduce(
-          (sum, item) => sum + item.history.length, 0
-        );
-        progress = Math.min(totalReviews, 10);
-        break;
-      }
+      case 'first_review': progress = Math.min(countReviews(), 1); break;
+      case 'review_ten': progress = Math.min(countReviews(), 10); break;
       case 'daily_goal':
         progress = profile.dailyProgress >= profile.dailyGoal ? 1 : 0;
         break;
@@ -506,21 +550,30 @@ function checkAchievements(profile: UserProfile): Achievement[] {
 
 // ============ Spaced Repetition (SM-2) ============
 
+// Adds a fresh SM-2 item unless one exists; returns whether the profile changed.
+// Callers that already formatted today's date pass it in.
+function ensureReviewItem(
+  profile: UserProfile,
+  questionId: number,
+  today: string = new Date().toISOString().split('T')[0]
+): boolean {
+  const qid = String(questionId);
+  if (profile.spacedRepetition[qid]) return false;
+  profile.spacedRepetition[qid] = {
+    ease: 2.5,
+    interval: 0,
+    reps: 0,
+    nextReview: today,
+    lastReview: null,
+    history: [],
+  };
+  return true;
+}
+
 export function addToReview(username: string, questionId: number) {
   const profile = getUserProfile(username);
   if (!profile) return;
-  const qid = String(questionId);
-  if (!profile.spacedRepetition[qid]) {
-    profile.spacedRepetition[qid] = {
-      ease: 2.5,
-      interval: 0,
-      reps: 0,
-      nextReview: new Date().toISOString().split('T')[0],
-      lastReview: null,
-      history: [],
-    };
-    saveUserProfile(profile);
-  }
+  if (ensureReviewItem(profile, questionId)) saveUserProfile(profile);
 }
 
 export function recordReview(username: string, questionId: number, quality: number) {
@@ -547,12 +600,13 @@ export function recordReview(username: string, questionId: number, quality: numb
 
   item.ease = Math.round(newEase * 10000) / 10000;
   const now = new Date();
-  item.lastReview = now.toISOString();
+  const nowIso = now.toISOString();
+  item.lastReview = nowIso;
   const nextDate = new Date(now);
   nextDate.setDate(nextDate.getDate() + item.interval);
   item.nextReview = nextDate.toISOString().split('T')[0];
   item.history.push({
-    date: now.toISOString(),
+    date: nowIso,
     quality,
     interval: item.interval,
   });
@@ -570,7 +624,8 @@ export function getDueReviews(username: string): { questionId: number; item: SRI
       due.push({ questionId: parseInt(qid), item });
     }
   }
-  due.sort((a, b) => a.item.nextReview.localeCompare(b.item.nextReview));
+  // YYYY-MM-DD keys order correctly as plain strings; no locale collation needed
+  due.sort((a, b) => (a.item.nextReview < b.item.nextReview ? -1 : a.item.nextReview > b.item.nextReview ? 1 : 0));
   return due;
 }
 
@@ -579,24 +634,34 @@ export function getReviewStats(username: string) {
   if (!profile) return { totalCards: 0, dueToday: 0, mature: 0, learning: 0, retentionRate: 0, totalReviews: 0, forecast: {} as Record<string, number> };
   const sr = profile.spacedRepetition;
   const today = new Date().toISOString().split('T')[0];
-  const total = Object.keys(sr).length;
-  const dueToday = Object.values(sr).filter(i => i.nextReview <= today).length;
-  const mature = Object.values(sr).filter(i => i.interval >= 21).length;
-  const learning = total - mature;
-  const totalReviews = Object.values(sr).reduce((s, i) => s + (i.history?.length || 0), 0);
-  const correctReviews = Object.values(sr).reduce(
-    (s, i) => s + (i.history?.filter((h: any) => h.quality >= 3)?.length || 0), 0
-  );
-  const retentionRate = totalReviews > 0 ? Math.round((correctReviews / totalReviews) * 100 * 10) / 10 : 0;
 
+  // Due counts for the next 7 days, filled in by the pass below
   const forecast: Record<string, number> = {};
   for (let i = 0; i < 7; i++) {
     const d = new Date();
     d.setDate(d.getDate() + i);
-    const ds = d.toISOString().split('T')[0];
-    forecast[ds] = Object.values(sr).filter(item => item.nextReview === ds).length;
+    forecast[d.toISOString().split('T')[0]] = 0;
   }
 
+  // All counters in a single pass over the review items
+  let total = 0;
+  let dueToday = 0;
+  let mature = 0;
+  let totalReviews = 0;
+  let correctReviews = 0;
+  for (const item of Object.values(sr)) {
+    total++;
+    if (item.nextReview <= today) dueToday++;
+    if (item.interval >= 21) mature++;
+    if (forecast[item.nextReview] !== undefined) forecast[item.nextReview]++;
+    for (const h of item.history ?? []) {
+      totalReviews++;
+      if (h.quality >= 3) correctReviews++;
+    }
+  }
+  const learning = total - mature;
+  const retentionRate = totalReviews > 0 ? Math.round((correctReviews / totalReviews) * 100 * 10) / 10 : 0;
+
   return { totalCards: total, dueToday, mature, learning, retentionRate, totalReviews, forecast };
 }
 
@@ -661,22 +726,32 @@ export function getLeaderboard(metric: 'totalQuestions' | 'accuracy' | 'bestStre
     bestStreak: u.stats.bestStreak,
     xp: u.xp,
     level: u.level,
-    levelInfo: getLevelInfo(u.xp),
   }));
   entries.sort((a, b) => {
     const av = a[metric] as number;
     const bv = b[metric] as number;
     return bv - av;
   });
-  return entries.slice(0, 20);
+  // Only the shown rows need their level badge resolved
+  return entries.slice(0, 20).map(e => ({ ...e, levelInfo: getLevelInfo(e.xp) }));
 }
 
 // ============ Report Generation ============
 
+// Wrong questions still to review, counted without allocating a filtered copy
+export function countUnmasteredWrongQuestions(profile: UserProfile): number {
+  let count = 0;
+  for (const w of profile.wrongQuestions) if (!w.mastered) count++;
+  return count;
+}
+
 export function generateReport(username: string) {
   const profile = getUserProfile(username);
-  if (!profile) return null;
+  return profile ? buildReport(profile) : null;
+}
 
+// Report for an already loaded profile, for callers that hold one in memory
+export function buildReport(profile: UserProfile) {
   const conceptBreakdown = Object.entries(profile.stats.conceptStats).map(([concept, s]) => ({
     concept,
     total: s.total,
@@ -684,8 +759,20 @@ export function generateReport(username: string) {
     accuracy: s.total > 0 ? Math.round((s.correct / s.total) * 100 * 10) / 10 : 0,
   })).sort((a, b) => a.accuracy - b.accuracy);
 
-  const strengths = [...conceptBreakdown].filter(c => c.total >= 2).sort((a, b) => b.accuracy - a.accuracy).slice(0, 3);
-  const weaknesses = [...conceptBreakdown].filter(c => c.total >= 2).sort((a, b) => a.accuracy - b.accuracy).slice(0, 3);
+  // Concepts with enough answers to rank, filtered once for both lists.
+  // conceptBreakdown is already ascending by accuracy, so neither list needs
+  // a re-sort: weaknesses are the head, strengths are read from the tail one
+  // accuracy group at a time, keeping ties in list order as a stable sort would.
+  const ranked = conceptBreakdown.filter(c => c.total >= 2);
+  const weaknesses = ranked.slice(0, 3);
+  const strengths: typeof ranked = [];
+  let groupEnd = ranked.length;
+  while (strengths.length < 3 && groupEnd > 0) {
+    let groupStart = groupEnd - 1;
+    while (groupStart > 0 && ranked[groupStart - 1].accuracy === ranked[groupEnd - 1].accuracy) groupStart--;
+    for (let i = groupStart; i < groupEnd && strengths.length < 3; i++) strengths.push(ranked[i]);
+    groupEnd = groupStart;
+  }
 
   const recommendations: string[] = [];
   if (profile.stats.accuracy < 60) recommendations.push('Consider reviewing foundational concepts before tackling harder questions.');
@@ -704,7 +791,7 @@ export function generateReport(username: string) {
     xp: profile.xp,
     level: getLevelInfo(profile.xp),
     streak: profile.streak,
-    wrongQuestionCount: profile.wrongQuestions.filter(w => !w.mastered).length,
+    wrongQuestionCount: countUnmasteredWrongQuestions(profile),
   };
 }
 
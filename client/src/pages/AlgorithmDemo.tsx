@@ -14,19 +14,70 @@ import { useState, useMemo } from 'react';
 import { motion } from 'framer-motion';
 import {
   Brain, Zap, Target, TrendingDown, BarChart3, Activity,
-  CheckCircle, RefreshCw, ChevronDown, Info, ArrowRight
+  CheckCircle, RefreshCw, Info, ArrowRight
 } from 'lucide-react';
 import {
-  LineChart, Line, BarChart, Bar, XAxis, YAxis, CartesianGrid,
-  Tooltip, Legend, ResponsiveContainer, RadarChart, Radar,
-  PolarGrid, PolarAngleAxis, PolarRadiusAxis, ReferenceLine,
-  Cell, Area, AreaChart, ComposedChart, Scatter
+  Line, BarChart, Bar, XAxis, YAxis, CartesianGrid,
+  Tooltip, Legend, ResponsiveContainer, ReferenceLine,
+  Cell, Area, AreaChart, ComposedChart
 } from 'recharts';
 import {
   OVERALL_STATS, ABILITY_LEVEL_SUMMARY, REPRESENTATIVE_TRAJECTORIES,
-  CONVERGENCE_RAW_DATA, ALGORITHM_STEPS
+  ALGORITHM_STEPS, TrajectoryPoint
 } from '@/lib/simulation-data';
 
+// Trajectories grouped by (ability, mode) once, with points indexed by step,
+// so building chart data does not rescan the trajectory arrays per step
+const TRAJECTORY_INDEX = new Map<string, Map<number, TrajectoryPoint>>(
+  REPRESENTATIVE_TRAJECTORIES.map(t => [
+    `${t.trueAbility}|${t.mode}`,
+    new Map(t.trajectory.map(p => [p.step, p] as const)),
+  ])
+);
+
+function getTrajectoryPair(ability: number) {
+  const adaptive = TRAJECTORY_INDEX.get(`${ability}|Adaptive`);
+  const linear = TRAJECTORY_INDEX.get(`${ability}|Linear`);
+  if (!adaptive || !linear) return null;
+  const maxStep = Math.max(...Array.from(adaptive.keys()), ...Array.from(linear.keys()));
+  return { adaptive, linear, maxStep };
+}
+
+// The simulation results are static, so the summary chart data is built
+// once when the page module loads rather than on every mount.
+
+// Boxplot-style data (mean + std for each ability level)
+const BOXPLOT_DATA = ABILITY_LEVEL_SUMMARY.map(s => ({
+  ability: s.ability.toFixed(1),
+  adaptiveMean: s.adaptiveMean,
+  adaptiveStd: s.adaptiveStd,
+  linearMean: s.linearMean,
+  linearStd: s.linearStd,
+  adaptiveHigh: Math.min(s.adaptiveMean + s.adaptiveStd, 50),
+  adaptiveLow: Math.max(s.adaptiveMean - s.adaptiveStd, 0),
+  linearHigh: Math.min(s.linearMean + s.linearStd, 50),
+  linearLow: Math.max(s.linearMean - s.linearStd, 0),
+}));
+
+// Improvement bar chart data
+const IMPROVEMENT_DATA = ABILITY_LEVEL_SUMMARY
+  .filter(s => s.improvement > 0)
+  .map(s => ({
+    ability: `θ=${s.ability}`,
+    improvement: s.improvement,
+    significant: s.significant,
+    pValue: s.pValue,
+  }));
+
+const ICON_MAP: Record<string, React.ElementType> = {
+  'brain': Brain,
+  'target': Target,
+  'zap': Zap,
+  'activity': Activity,
+  'refresh-cw': RefreshCw,
+  'check-circle': CheckCircle,
+};
+
 // ============================================================
 // Sub-components
 // ============================================================
@@ -81,112 +132,34 @@ export default function AlgorithmDemo() {
   const [selectedAbility, setSelectedAbility] = useState(0.5);
   const [showAllLevels, setShowAllLevels] = useState(false);
 
-  // Prepare convergence trajectory data for selected ability
-  const trajectoryData = useMemo(() => {
-    const adaptive = REPRESENTATIVE_TRAJECTORIES.find(
-      t => t.trueAbility === selectedAbility && t.mode === 'Adaptive'
-    );
-    const linear = REPRESENTATIVE_TRAJECTORIES.find(
-      t => t.trueAbility === selectedAbility && t.mode === 'Linear'
-    );
-    if (!adaptive || !linear) return [];
-
-    const maxStep = Math.max(
-      adaptive.trajectory[adaptive.trajectory.length - 1].step,
-      linear.trajectory[linear.trajectory.length - 1].step
-    );
-    const data: { step: number; adaptive?: number; linear?: number; trueAbility: number }[] = [];
+  // Ability and entropy trajectories for the selected ability, built in one
+  // walk over the steps with gaps filled from the last known value
+  const { trajectoryData, entropyData } = useMemo(() => {
+    const trajectoryData: { step: number; adaptive?: number; linear?: number; trueAbility: number }[] = [];
+    const entropyData: { step: number; adaptive?: number; linear?: number }[] = [];
+    const pair = getTrajectoryPair(selectedAbility);
+    if (!pair) return { trajectoryData, entropyData };
+    const { adaptive, linear, maxStep } = pair;
+
+    let lastA: TrajectoryPoint | undefined, lastL: TrajectoryPoint | undefined;
     for (let s = 0; s <= maxStep; s++) {
-      const aPoint = adaptive.trajectory.find(p => p.step === s);
-      const lPoint = linear.trajectory.find(p => p.step === s);
-      data.push({
+      lastA = adaptive.get(s) ?? lastA;
+      lastL = linear.get(s) ?? lastL;
+      trajectoryData.push({
         step: s,
-        adaptive: aPoint?.estimatedAbility,
-        linear: lPoint?.estimatedAbility,
+        adaptive: lastA?.estimatedAbility,
+        linear: lastL?.estimatedAbility,
         trueAbility: selectedAbility,
       });
-    }
-    // Fill gaps with last known value
-    let lastA: number | undefined, lastL: number | undefined;
-    for (const d of data) {
-      if (d.adaptive !== undefined) lastA = d.adaptive;
-      else d.adaptive = lastA;
-      if (d.linear !== undefined) lastL = d.linear;
-      else d.linear = lastL;
-    }
-    return data;
-  }, [selectedAbility]);
-
-  // Prepare entropy trajectory data
-  const entropyData = useMemo(() => {
-    const adaptive = REPRESENTATIVE_TRAJECTORIES.find(
-      t => t.trueAbility === selectedAbility && t.mode === 'Adaptive'
-    );
-    const linear = REPRESENTATIVE_TRAJECTORIES.find(
-      t => t.trueAbility === selectedAbility && t.mode === 'Linear'
-    );
-    if (!adaptive || !linear) return [];
-
-    const maxStep = Math.max(
-      adaptive.trajectory[adaptive.trajectory.length - 1].step,
-      linear.trajectory[linear.trajectory.length - 1].step
-    );
-    const data: { step: number; adaptive?: number; linear?: number }[] = [];
-    for (let s = 0; s <= maxStep; s++) {
-      const aPoint = adaptive.trajectory.find(p => p.step === s);
-      const lPoint = linear.trajectory.find(p => p.step === s);
-      data.push({
+      entropyData.push({
         step: s,
-        adaptive: aPoint?.entropy,
-        linear: lPoint?.entropy,
+        adaptive: lastA?.entropy,
+        linear: lastL?.entropy,
       });
     }
-    let lastA: number | undefined, lastL: number | undefined;
-    for (const d of data) {
-      if (d.adaptive !== undefined) lastA = d.adaptive;
-      else d.adaptive = lastA;
-      if (d.linear !== undefined) lastL = d.linear;
-      else d.linear = lastL;
-    }
-    return data;
+    return { trajectoryData, entropyData };
   }, [selectedAbility]);
 
-  // Prepare boxplot-style data (mean + std for each ability level)
-  const boxplotData = useMemo(() => {
-    return ABILITY_LEVEL_SUMMARY.map(s => ({
-      ability: s.ability.toFixed(1),
-      adaptiveMean: s.adaptiveMean,
-      adaptiveStd: s.adaptiveStd,
-      linearMean: s.linearMean,
-      linearStd: s.linearStd,
-      adaptiveHigh: Math.min(s.adaptiveMean + s.adaptiveStd, 50),
-      adaptiveLow: Math.max(s.adaptiveMean - s.adaptiveStd, 0),
-      linearHigh: Math.min(s.linearMean + s.linearStd, 50),
-      linearLow: Math.max(s.linearMean - s.linearStd, 0),
-    }));
-  }, []);
-
-  // Prepare improvement bar chart data
-  const improvementData = useMemo(() => {
-    return ABILITY_LEVEL_SUMMARY
-      .filter(s => s.improvement > 0)
-      .map(s => ({
-        ability: `θ=${s.ability}`,
-        improvement: s.improvement,
-        significant: s.significant,
-        pValue: s.pValue,
-      }));
-  }, []);
-
-  const iconMap: Record<string, React.ElementType> = {
-    'brain': Brain,
-    'target': Target,
-    'zap': Zap,
-    'activity': Activity,
-    'refresh-cw': RefreshCw,
-    'check-circle': CheckCircle,
-  };
-
   return (
     <div className="space-y-8 pb-12">
       {/* Hero Section */}
@@ -419,7 +392,7 @@ export default function AlgorithmDemo() {
 
         <div className="h-80">
           <ResponsiveContainer width="100%" height="100%">
-            <BarChart data={boxplotData} barGap={4}>
+            <BarChart data={BOXPLOT_DATA} barGap={4}>
               <CartesianGrid strokeDasharray="3 3" stroke="#e2e8f0" />
               <XAxis
                 dataKey="ability"
@@ -457,7 +430,7 @@ export default function AlgorithmDemo() {
 
         <div className="h-64">
           <ResponsiveContainer width="100%" height="100%">
-            <BarChart data={improvementData} layout="vertical">
+            <BarChart data={IMPROVEMENT_DATA} layout="vertical">
               <CartesianGrid strokeDasharray="3 3" stroke="#e2e8f0" />
               <XAxis
                 type="number"
@@ -479,7 +452,7 @@ export default function AlgorithmDemo() {
                 ]}
               />
               <Bar dataKey="improvement" radius={[0, 8, 8, 0]} maxBarSize={32}>
-                {improvementData.map((entry, index) => (
+                {IMPROVEMENT_DATA.map((entry, index) => (
                   <Cell
                     key={index}
                     fill={entry.significant ? '#3b82f6' : '#93c5fd'}
@@ -600,7 +573,7 @@ export default function AlgorithmDemo() {
 
         <div className="space-y-4">
           {ALGORITHM_STEPS.map((step, i) => {
-            const StepIcon = iconMap[step.icon] || Brain;
+            const StepIcon = ICON_MAP[step.icon] || Brain;
             return (
               <motion.div
                 key={i}
@@ -1,15 +1,46 @@
 import { useState, useEffect, useRef, useCallback } from 'react';
 import { useAuth } from '@/contexts/AuthContext';
 import { GlassCard } from '@/components/GlassCard';
-import { questions, Question, CONCEPTS } from '@/lib/questions';
+import { questions, Question, CONCEPTS, getQuestionById, getQuestionsByConceptMap } from '@/lib/questions';
 import { recordAnswer, saveChallengeResult, getChallengeHistory, ChallengeResult } from '@/lib/store';
 import { motion, AnimatePresence } from 'framer-motion';
 import { Timer, Play, Trophy, Target, Clock, Zap, CheckCircle2, XCircle } from 'lucide-react';
-import { toast } from 'sonner';
 import { cn } from '@/lib/utils';
 
 type ChallengeState = 'setup' | 'playing' | 'finished';
 
+interface ChallengeAnswer {
+  questionId: number;
+  answer: string;
+  correct: boolean;
+  timeSpent: number;
+}
+
+// Score and per-concept breakdown in one pass over the answers
+function buildChallengeResult(answers: ChallengeAnswer[], timeLimit: number, timeUsed: number): ChallengeResult {
+  let totalCorrect = 0;
+  const conceptBreakdown: Record<string, { total: number; correct: number }> = {};
+  for (const a of answers) {
+    if (a.correct) totalCorrect++;
+    const q = getQuestionById(a.questionId);
+    if (!q) continue;
+    let conceptStat = conceptBreakdown[q.concept];
+    if (!conceptStat) conceptStat = conceptBreakdown[q.concept] = { total: 0, correct: 0 };
+    conceptStat.total++;
+    if (a.correct) conceptStat.correct++;
+  }
+
+  return {
+    totalQuestions: answers.length,
+    correctAnswers: totalCorrect,
+    accuracy: answers.length > 0 ? Math.round((totalCorrect / answers.length) * 100) : 0,
+    timeUsed,
+    timeLimit,
+    conceptBreakdown,
+    date: new Date().toISOString(),
+  };
+}
+
 export default function Challenge() {
   const { user, refreshProfile } = useAuth();
   const [state, setState] = useState<ChallengeState>('setup');
@@ -18,23 +49,27 @@ export default function Challenge() {
   const [selectedConcept, setSelectedConcept] = useState('all');
   const [challengeQuestions, setChallengeQuestions] = useState<Question[]>([]);
   const [currentIndex, setCurrentIndex] = useState(0);
-  const [answers, setAnswers] = useState<{ questionId: number; answer: string; correct: boolean; timeSpent: number }[]>([]);
+  const [answers, setAnswers] = useState<ChallengeAnswer[]>([]);
   const [timeRemaining, setTimeRemaining] = useState(0);
   const [selectedAnswer, setSelectedAnswer] = useState<string | null>(null);
   const [showResult, setShowResult] = useState(false);
   const timerRef = useRef<ReturnType<typeof setInterval> | null>(null);
   const questionStartRef = useRef(Date.now());
-  const history = getChallengeHistory(user || '');
 
   const startChallenge = () => {
-    let pool = [...questions];
-    if (selectedConcept !== 'all') pool = pool.filter(q => q.concept === selectedConcept);
-    // Shuffle
-    for (let i = pool.length - 1; i > 0; i--) {
-      const j = Math.floor(Math.random() * (i + 1));
+    // Start from the prebuilt per-concept list instead of filtering a copy
+    // of the whole bank, and only shuffle as far as the questions needed:
+    // a partial Fisher-Yates draws each of the first `count` slots uniformly
+    const source = selectedConcept === 'all'
+      ? questions
+      : getQuestionsByConceptMap()[selectedConcept] ?? [];
+    const pool = source.slice();
+    const count = Math.min(numQuestions, pool.length);
+    for (let i = 0; i < count; i++) {
+      const j = i + Math.floor(Math.random() * (pool.length - i));
       [pool[i], pool[j]] = [pool[j], pool[i]];
     }
-    const selected = pool.slice(0, Math.min(numQuestions, pool.length));
+    const selected = pool.slice(0, count);
     setChallengeQuestions(selected);
     setCurrentIndex(0);
     setAnswers([]);
@@ -50,25 +85,7 @@ export default function Challenge() {
     setState('finished');
     if (!user) return;
 
-    const totalCorrect = answers.filter(a => a.correct).length;
-    const conceptBreakdown: Record<string, { total: number; correct: number }> = {};
-    for (const a of answers) {
-      const q = questions.find(qq => qq.id === a.questionId);
-      if (!q) continue;
-      if (!conceptBreakdown[q.concept]) conceptBreakdown[q.concept] = { total: 0, correct: 0 };
-      conceptBreakdown[q.concept].total++;
-      if (a.correct) conceptBreakdown[q.concept].correct++;
-    }
-
-    const result: ChallengeResult = {
-      totalQuestions: answers.length,
-      correctAnswers: totalCorrect,
-      accuracy: answers.length > 0 ? Math.round((totalCorrect / answers.length) * 100) : 0,
-      timeUsed: timeLimit - timeRemaining,
-      timeLimit,
-      conceptBreakdown,
-      date: new Date().toISOString(),
-    };
+    const result = buildChallengeResult(answers, timeLimit, timeLimit - timeRemaining);
     saveChallengeResult(user, result);
     refreshProfile();
   }, [answers, timeLimit, timeRemaining, user, refreshProfile]);
@@ -104,27 +121,10 @@ export default function Challenge() {
     // Auto advance after delay
     setTimeout(() => {
       if (currentIndex + 1 >= challengeQuestions.length) {
-        // Use the updated answers
-        const totalCorrect = newAnswers.filter(a => a.correct).length;
-        const conceptBreakdown: Record<string, { total: number; correct: number }> = {};
-        for (const a of newAnswers) {
-          const qq = questions.find(qqq => qqq.id === a.questionId);
-          if (!qq) continue;
-          if (!conceptBreakdown[qq.concept]) conceptBreakdown[qq.concept] = { total: 0, correct: 0 };
-          conceptBreakdown[qq.concept].total++;
-          if (a.correct) conceptBreakdown[qq.concept].correct++;
-        }
         if (timerRef.current) clearInterval(timerRef.current);
         setState('finished');
-        const result: ChallengeResult = {
-          totalQuestions: newAnswers.length,
-          correctAnswers: totalCorrect,
-          accuracy: newAnswers.length > 0 ? Math.round((totalCorrect / newAnswers.length) * 100) : 0,
-          timeUsed: timeLimit - timeRemaining,
-          timeLimit,
-          conceptBreakdown,
-          date: new Date().toISOString(),
-        };
+        // Use the updated answers
+        const result = buildChallengeResult(newAnswers, timeLimit, timeLimit - timeRemaining);
         saveChallengeResult(user, result);
         refreshProfile();
       } else {
@@ -144,6 +144,9 @@ export default function Challenge() {
 
   // Setup Screen
   if (state === 'setup') {
+    // Read here rather than at the top: the countdown re-renders the page
+    // every second while playing, and only this screen shows the history.
+    const history = getChallengeHistory(user || '');
     return (
       <div className="space-y-6 max-w-3xl mx-auto">
         <div>
@@ -226,8 +229,8 @@ export default function Challenge() {
               Challenge History
             </h3>
             <div className="space-y-2">
-              {history.slice(-5).reverse().map((h, i) => (
-                <div key={i} className="flex items-center justify-between p-3 rounded-xl bg-white/50 text-xs">
+              {history.slice(-5).reverse().map(h => (
+                <div key={h.date} className="flex items-center justify-between p-3 rounded-xl bg-white/50 text-xs">
                   <span className="text-muted-foreground">{new Date(h.date).toLocaleDateString('en-US', { month: 'short', day: 'numeric' })}</span>
                   <span className="font-medium">{h.correctAnswers}/{h.totalQuestions}</span>
                   <span className={cn('font-bold', h.accuracy >= 80 ? 'text-emerald-500' : h.accuracy >= 60 ? 'text-amber-500' : 'text-red-500')}>
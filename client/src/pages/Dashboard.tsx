@@ -1,6 +1,7 @@
+import { useMemo } from 'react';
 import { useAuth } from '@/contexts/AuthContext';
 import { GlassCard, StatCard } from '@/components/GlassCard';
-import { getLevelInfo, getReviewStats, getChallengeHistory } from '@/lib/store';
+import { getLevelInfo, getReviewStats, getChallengeHistory, countUnmasteredWrongQuestions } from '@/lib/store';
 import { questions, CONCEPTS } from '@/lib/questions';
 import { motion } from 'framer-motion';
 import {
@@ -16,29 +17,41 @@ export default function Dashboard() {
   const { profile, user } = useAuth();
   const [, navigate] = useLocation();
 
-  if (!profile || !user) return null;
+  // Chart data only changes when the profile is reloaded after a write
+  const { radarData, trendData } = useMemo(() => {
+    if (!profile) return { radarData: [], trendData: [] };
 
-  const levelInfo = getLevelInfo(profile.xp);
-  const reviewStats = getReviewStats(user);
-  const challengeHistory = getChallengeHistory(user);
+    // Concept mastery for radar chart
+    const radarData = CONCEPTS.map(c => {
+      const s = profile.stats.conceptStats[c];
+      const accuracy = s && s.total > 0 ? Math.round((s.correct / s.total) * 100) : 0;
+      return { concept: c.length > 12 ? c.slice(0, 10) + '…' : c, accuracy, fullName: c };
+    });
 
-  // Concept mastery for radar chart
-  const radarData = CONCEPTS.map(c => {
-    const s = profile.stats.conceptStats[c];
-    const accuracy = s && s.total > 0 ? Math.round((s.correct / s.total) * 100) : 0;
-    return { concept: c.length > 12 ? c.slice(0, 10) + '…' : c, accuracy, fullName: c };
-  });
+    // Ability trend from session history, with the running correct count
+    // carried forward instead of re-filtering the history prefix per point
+    const trendData: { index: number; accuracy: number }[] = [];
+    const trendLength = Math.min(profile.sessionHistory.length, 30);
+    let trendCorrect = 0;
+    for (let i = 0; i < trendLength; i++) {
+      if (profile.sessionHistory[i].correct) trendCorrect++;
+      trendData.push({
+        index: i + 1,
+        accuracy: Math.round((trendCorrect / (i + 1)) * 100),
+      });
+    }
 
-  // Ability trend from session history
-  const trendData = profile.sessionHistory.slice(-30).reduce((acc, entry, i) => {
-    const correct = profile.sessionHistory.slice(0, i + 1).filter(e => e.correct).length;
-    const total = i + 1;
-    acc.push({
-      index: i + 1,
-      accuracy: Math.round((correct / total) * 100),
-    });
-    return acc;
-  }, [] as { index: number; accuracy: number }[]);
+    return { radarData, trendData };
+  }, [profile]);
+
+  // Both read and parse localStorage. Keyed on the profile as well, since
+  // refreshProfile() runs after every review and challenge write.
+  const reviewStats = useMemo(() => (user ? getReviewStats(user) : null), [user, profile]);
+  const challengeHistory = useMemo(() => (user ? getChallengeHistory(user) : []), [user, profile]);
+
+  if (!profile || !user || !reviewStats) return null;
+
+  const levelInfo = getLevelInfo(profile.xp);
 
   const todayStr = new Date().toLocaleDateString('en-US', {
     year: 'numeric', month: 'long', day: 'numeric', weekday: 'long'
@@ -188,7 +201,7 @@ export default function Dashboard() {
       <div className="grid grid-cols-2 lg:grid-cols-4 gap-4">
         {[
           { label: 'Timed Challenge', icon: Clock, path: '/challenge', desc: `${challengeHistory.length} completed`, color: 'from-amber-500 to-orange-500' },
-          { label: 'Wrong Questions', icon: BookOpen, path: '/wrong-questions', desc: `${profile.wrongQuestions.filter(w => !w.mastered).length} to review`, color: 'from-red-500 to-pink-500' },
+          { label: 'Wrong Questions', icon: BookOpen, path: '/wrong-questions', desc: `${countUnmasteredWrongQuestions(profile)} to review`, color: 'from-red-500 to-pink-500' },
           { label: 'Spaced Review', icon: Zap, path: '/review', desc: `${reviewStats.dueToday} due today`, color: 'from-emerald-500 to-teal-500' },
           { label: 'Knowledge Graph', icon: Brain, path: '/knowledge-graph', desc: 'View knowledge map', color: 'from-violet-500 to-purple-500' },
         ].map((item) => (
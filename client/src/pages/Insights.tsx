@@ -1,7 +1,6 @@
 import { useMemo } from 'react';
 import { useAuth } from '@/contexts/AuthContext';
 import { GlassCard, StatCard } from '@/components/GlassCard';
-import { getUserProfile } from '@/lib/store';
 import {
   BarChart3, Clock, TrendingUp, Brain, Calendar, Activity,
   Zap, GitCompare, ArrowUpRight, ArrowDownRight, Download
@@ -23,9 +22,22 @@ const tooltipStyle = {
   boxShadow: '0 4px 12px rgba(0,0,0,0.08)',
 };
 
+// Beyond this many points the per-point markers and line animation are
+// dropped; each marker is its own SVG node and long histories add hundreds.
+const DENSE_SERIES_POINTS = 60;
+
+// Built once: toLocaleDateString() with options sets up a new formatter
+// on every call, and the daily breakdown formats every session.
+const DAY_LABEL_FORMAT = new Intl.DateTimeFormat('en-US', { month: 'short', day: 'numeric' });
+
+function difficultyBin(difficulty: number): 'easy' | 'medium' | 'hard' {
+  return difficulty < 0.3 ? 'easy' : difficulty < 0.6 ? 'medium' : 'hard';
+}
+
 export default function Insights() {
-  const { user } = useAuth();
-  const profile = user ? getUserProfile(user) : null;
+  // The context profile only changes identity when refreshProfile() reloads it,
+  // so the analytics below are recomputed exactly when new answers are stored.
+  const { user, profile } = useAuth();
 
   const data = useMemo(() => {
     if (!profile) return null;
@@ -33,18 +45,32 @@ export default function Insights() {
     const sessions = profile.sessionHistory;
     if (sessions.length === 0) return null;
 
-    // Separate by mode
-    const adaptiveSessions = sessions.filter(s => s.mode === 'adaptive' || !s.mode);
-    const fixedSessions = sessions.filter(s => s.mode === 'fixed');
+    // Separate by mode in a single pass
+    const adaptiveSessions: typeof sessions = [];
+    const fixedSessions: typeof sessions = [];
+    for (const s of sessions) {
+      if (s.mode === 'fixed') fixedSessions.push(s);
+      else adaptiveSessions.push(s);
+    }
 
-    // Daily breakdown
+    // Daily breakdown, hourly distribution, total time and study days.
+    // Each timestamp is parsed once and shared by all four.
     const dailyMap: Record<string, { total: number; correct: number; time: number }> = {};
+    const hourCounts: number[] = Array(24).fill(0);
+    const uniqueDays = new Set<string>();
+    let totalTime = 0;
     for (const s of sessions) {
-      const day = new Date(s.timestamp).toLocaleDateString('en-US', { month: 'short', day: 'numeric' });
-      if (!dailyMap[day]) dailyMap[day] = { total: 0, correct: 0, time: 0 };
-      dailyMap[day].total++;
-      if (s.correct) dailyMap[day].correct++;
-      dailyMap[day].time += s.timeSpent;
+      const date = new Date(s.timestamp);
+      const day = DAY_LABEL_FORMAT.format(date);
+      let dayStats = dailyMap[day];
+      if (!dayStats) dayStats = dailyMap[day] = { total: 0, correct: 0, time: 0 };
+      dayStats.total++;
+      if (s.correct) dayStats.correct++;
+      dayStats.time += s.timeSpent;
+
+      hourCounts[date.getHours()]++;
+      uniqueDays.add(date.toDateString());
+      totalTime += s.timeSpent;
     }
     const dailyData = Object.entries(dailyMap).map(([date, d]) => ({
       date,
@@ -53,74 +79,56 @@ export default function Insights() {
       avgTime: d.total > 0 ? Math.round(d.time / d.total) : 0,
     }));
 
-    // Hourly distribution
-    const hourMap: Record<number, number> = {};
-    for (const s of sessions) {
-      const hour = new Date(s.timestamp).getHours();
-      hourMap[hour] = (hourMap[hour] || 0) + 1;
-    }
-    const hourlyData = Array.from({ length: 24 }, (_, h) => ({
+    // Hourly distribution: a dense count per hour of day
+    const hourlyData = hourCounts.map((count, h) => ({
       hour: `${h}:00`,
-      count: hourMap[h] || 0,
+      count,
     }));
 
     // Average time per question
-    const totalTime = sessions.reduce((sum, s) => sum + s.timeSpent, 0);
     const avgTime = sessions.length > 0 ? Math.round(totalTime / sessions.length) : 0;
 
-    // Study streak
-    const uniqueDays = new Set(sessions.map(s => new Date(s.timestamp).toDateString()));
-
-    // Difficulty distribution
-    const diffMap = { easy: 0, medium: 0, hard: 0 };
-    for (const s of sessions) {
-      if (s.difficulty < 0.3) diffMap.easy++;
-      else if (s.difficulty < 0.6) diffMap.medium++;
-      else diffMap.hard++;
-    }
-
     // ===== Adaptive vs Fixed Comparison =====
     const calcModeStats = (arr: typeof sessions) => {
       const total = arr.length;
-      const correct = arr.filter(s => s.correct).length;
-      const accuracy = total > 0 ? Math.round((correct / total) * 100) : 0;
-      const avgT = total > 0 ? Math.round(arr.reduce((s, e) => s + e.timeSpent, 0) / total) : 0;
-
-      // Concept accuracy
+      let correct = 0;
+      let timeSum = 0;
       const conceptMap: Record<string, { total: number; correct: number }> = {};
-      for (const s of arr) {
-        if (!conceptMap[s.concept]) conceptMap[s.concept] = { total: 0, correct: 0 };
-        conceptMap[s.concept].total++;
-        if (s.correct) conceptMap[s.concept].correct++;
-      }
-
-      // Difficulty accuracy
       const diffAcc = { easy: { t: 0, c: 0 }, medium: { t: 0, c: 0 }, hard: { t: 0, c: 0 } };
-      for (const s of arr) {
-        const d = s.difficulty < 0.3 ? 'easy' : s.difficulty < 0.6 ? 'medium' : 'hard';
+      const rolling: { step: number; accuracy: number }[] = [];
+      const abilityTrajectory: { step: number; ability: number }[] = [];
+      const entropyTrajectory: { step: number; entropy: number }[] = [];
+
+      // Accuracy, time, concept/difficulty accuracy, rolling accuracy (every
+      // 5 questions) and ability/entropy trajectories, all in a single pass
+      for (let i = 0; i < arr.length; i++) {
+        const s = arr[i];
+        if (s.correct) correct++;
+        timeSum += s.timeSpent;
+
+        let conceptAcc = conceptMap[s.concept];
+        if (!conceptAcc) conceptAcc = conceptMap[s.concept] = { total: 0, correct: 0 };
+        conceptAcc.total++;
+        if (s.correct) conceptAcc.correct++;
+
+        const d = difficultyBin(s.difficulty);
         diffAcc[d].t++;
         if (s.correct) diffAcc[d].c++;
-      }
 
-      // Rolling accuracy (every 5 questions)
-      const rolling: { step: number; accuracy: number }[] = [];
-      let rc = 0;
-      for (let i = 0; i < arr.length; i++) {
-        if (arr[i].correct) rc++;
         if ((i + 1) % 5 === 0 || i === arr.length - 1) {
-          rolling.push({ step: i + 1, accuracy: Math.round((rc / (i + 1)) * 100) });
+          rolling.push({ step: i + 1, accuracy: Math.round((correct / (i + 1)) * 100) });
         }
-      }
 
-      // Ability trajectory
-      const abilityTrajectory = arr
-        .filter(s => s.abilityAfter !== undefined)
-        .map((s, i) => ({ step: i + 1, ability: s.abilityAfter! }));
+        if (s.abilityAfter !== undefined) {
+          abilityTrajectory.push({ step: abilityTrajectory.length + 1, ability: s.abilityAfter });
+        }
+        if (s.entropyAfter !== undefined) {
+          entropyTrajectory.push({ step: entropyTrajectory.length + 1, entropy: s.entropyAfter });
+        }
+      }
 
-      // Entropy trajectory
-      const entropyTrajectory = arr
-        .filter(s => s.entropyAfter !== undefined)
-        .map((s, i) => ({ step: i + 1, entropy: s.entropyAfter! }));
+      const accuracy = total > 0 ? Math.round((correct / total) * 100) : 0;
+      const avgT = total > 0 ? Math.round(timeSum / total) : 0;
 
       return {
         total, correct, accuracy, avgTime: avgT,
@@ -131,6 +139,14 @@ export default function Insights() {
     const adaptiveStats = calcModeStats(adaptiveSessions);
     const fixedStats = calcModeStats(fixedSessions);
 
+    // Difficulty distribution: the per-mode passes above already binned
+    // every session, so the overall counts are just their sums
+    const diffMap = {
+      easy: adaptiveStats.diffAcc.easy.t + fixedStats.diffAcc.easy.t,
+      medium: adaptiveStats.diffAcc.medium.t + fixedStats.diffAcc.medium.t,
+      hard: adaptiveStats.diffAcc.hard.t + fixedStats.diffAcc.hard.t,
+    };
+
     // Concept comparison radar data
     const allConcepts = new Set([
       ...Object.keys(adaptiveStats.conceptMap),
@@ -225,6 +241,8 @@ export default function Insights() {
     );
   };
 
+  const abilitySparse = data.abilityComparison.length <= DENSE_SERIES_POINTS;
+
   return (
     <div className="space-y-5 max-w-5xl mx-auto">
       <div className="flex items-center justify-between">
@@ -367,8 +385,8 @@ export default function Insights() {
                       <YAxis domain={[0, 1]} tick={{ fontSize: 10, fill: '#94a3b8' }} />
                       <Tooltip contentStyle={tooltipStyle} formatter={(v: number) => v !== null ? v.toFixed(3) : 'N/A'} />
                       <Legend wrapperStyle={{ fontSize: '11px' }} />
-                      <Line type="monotone" dataKey="adaptive" stroke="#3B82F6" strokeWidth={2.5} dot={{ r: 2 }} name="Adaptive" connectNulls />
-                      <Line type="monotone" dataKey="fixed" stroke="#F97316" strokeWidth={2.5} dot={{ r: 2 }} name="Fixed Sequence" connectNulls />
+                      <Line type="monotone" dataKey="adaptive" stroke="#3B82F6" strokeWidth={2.5} dot={abilitySparse && { r: 2 }} isAnimationActive={abilitySparse} name="Adaptive" connectNulls />
+                      <Line type="monotone" dataKey="fixed" stroke="#F97316" strokeWidth={2.5} dot={abilitySparse && { r: 2 }} isAnimationActive={abilitySparse} name="Fixed Sequence" connectNulls />
                     </LineChart>
                   </ResponsiveContainer>
                 </div>
@@ -437,7 +455,9 @@ export default function Insights() {
         )}
       </GlassCard>
 
-      {/* Daily Activity */}
+      {/* Daily Activity. The overview charts below render without the
+          entry animation: they are static summaries, and the hourly chart
+          alone animates 24 bars every time the page is opened. */}
       <GlassCard hover={false}>
         <h3 className="text-sm font-semibold text-foreground mb-3 flex items-center gap-2">
           <TrendingUp size={16} className="text-blue-500" />
@@ -450,7 +470,7 @@ export default function Insights() {
               <XAxis dataKey="date" tick={{ fontSize: 10, fill: '#94a3b8' }} />
               <YAxis tick={{ fontSize: 10, fill: '#94a3b8' }} allowDecimals={false} />
               <Tooltip contentStyle={tooltipStyle} />
-              <Bar dataKey="total" fill="#3B82F6" radius={[6, 6, 0, 0]} name="Questions" />
+              <Bar dataKey="total" fill="#3B82F6" radius={[6, 6, 0, 0]} name="Questions" isAnimationActive={false} />
             </BarChart>
           </ResponsiveContainer>
         </div>
@@ -475,7 +495,7 @@ export default function Insights() {
               <XAxis dataKey="date" tick={{ fontSize: 10, fill: '#94a3b8' }} />
               <YAxis domain={[0, 100]} tick={{ fontSize: 10, fill: '#94a3b8' }} />
               <Tooltip contentStyle={tooltipStyle} />
-              <Area type="monotone" dataKey="accuracy" stroke="#10B981" fill="url(#greenGrad)" strokeWidth={2} name="Accuracy %" />
+              <Area type="monotone" dataKey="accuracy" stroke="#10B981" fill="url(#greenGrad)" strokeWidth={2} name="Accuracy %" isAnimationActive={false} />
             </AreaChart>
           </ResponsiveContainer>
         </div>
@@ -494,7 +514,7 @@ export default function Insights() {
               <XAxis dataKey="hour" tick={{ fontSize: 9, fill: '#94a3b8' }} interval={2} />
               <YAxis tick={{ fontSize: 10, fill: '#94a3b8' }} allowDecimals={false} />
               <Tooltip contentStyle={tooltipStyle} />
-              <Bar dataKey="count" fill="#F59E0B" radius={[4, 4, 0, 0]} name="Questions" />
+              <Bar dataKey="count" fill="#F59E0B" radius={[4, 4, 0, 0]} name="Questions" isAnimationActive={false} />
             </BarChart>
           </ResponsiveContainer>
         </div>
@@ -4,8 +4,7 @@ import { GlassCard } from '@/components/GlassCard';
 import { KNOWLEDGE_GRAPH, getUserProfile } from '@/lib/store';
 import { CONCEPTS } from '@/lib/questions';
 import { motion } from 'framer-motion';
-import { Network, Circle, ArrowRight } from 'lucide-react';
-import { cn } from '@/lib/utils';
+import { Network } from 'lucide-react';
 
 // Simple force-directed layout positions (pre-calculated for stability)
 const NODE_POSITIONS: Record<string, { x: number; y: number }> = {
@@ -7,13 +7,11 @@ import { Crown, Medal, Trophy, Star, Target, Flame, BookOpen } from 'lucide-reac
 import { cn } from '@/lib/utils';
 
 export default function Leaderboard() {
-  const { user } = useAuth();
+  const { user, profile } = useAuth();
 
-  const leaderboard = getLeaderboard();
-
-  const sorted = useMemo(() => {
-    return [...leaderboard].sort((a, b) => b.xp - a.xp);
-  }, [leaderboard]);
+  // getLeaderboard() already ranks by XP. Only the signed-in user's data can
+  // change here, and refreshProfile() swaps the profile identity when it does.
+  const sorted = useMemo(() => getLeaderboard(), [profile]);
 
   const getRankIcon = (rank: number) => {
     if (rank === 1) return <Crown size={18} className="text-amber-500" />;
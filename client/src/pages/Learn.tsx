@@ -1,12 +1,12 @@
-import { useState, useEffect, useRef, useMemo } from 'react';
+import { useState, useEffect, useRef, useMemo, memo } from 'react';
 import { useAuth } from '@/contexts/AuthContext';
 import { GlassCard } from '@/components/GlassCard';
-import { questions, Question, CONCEPTS } from '@/lib/questions';
+import { questions, Question, CONCEPTS, getQuestionsByConceptMap } from '@/lib/questions';
 import {
   selectNextQuestion, updateBelief, createInitialBrainState, BrainState,
   expectedInformationGain, ABILITY_GRID
 } from '@/lib/adaptive-engine';
-import { recordAnswer, getUserProfile, saveUserProfile, addToReview } from '@/lib/store';
+import { recordAnswer, getUserProfile } from '@/lib/store';
 import { motion, AnimatePresence } from 'framer-motion';
 import {
   Brain, Lightbulb, CheckCircle2, XCircle, ArrowRight, Filter, Zap,
@@ -33,8 +33,330 @@ interface StepRecord {
   concept: string;
 }
 
+// X-axis values for the belief chart; the grid is fixed, so they are computed once
+const ABILITY_PERCENT = ABILITY_GRID.map(a => Math.round(a * 100));
+
+// Difficulty badge per bucket, checked in order against each upper bound
+const DIFFICULTY_BADGES = [
+  { max: 0.3, label: 'Easy', className: 'text-emerald-500 bg-emerald-50' },
+  { max: 0.6, label: 'Medium', className: 'text-amber-500 bg-amber-50' },
+  { max: Infinity, label: 'Hard', className: 'text-red-500 bg-red-50' },
+];
+
+function getDifficultyBadge(difficulty: number) {
+  return DIFFICULTY_BADGES.find(b => difficulty < b.max) ?? DIFFICULTY_BADGES[DIFFICULTY_BADGES.length - 1];
+}
+
+// Shared chart styling. Module constants keep the props referentially
+// stable, so Recharts does not treat them as changed on every render.
+const tooltipStyle = {
+  background: 'rgba(255,255,255,0.95)',
+  backdropFilter: 'blur(8px)',
+  border: '1px solid rgba(255,255,255,0.8)',
+  borderRadius: '10px',
+  fontSize: '11px',
+};
+
+const axisTick = { fontSize: 9, fill: '#94a3b8' };
+
+type AnalyticsTab = 'inference' | 'knowledge' | 'stats';
+
+interface AnalyticsPanelProps {
+  activeTab: AnalyticsTab;
+  onTabChange: (tab: AnalyticsTab) => void;
+  brainState: BrainState | null;
+  beliefDistData: { ability: number; probability: number }[];
+  convergenceData: { step: number; ability: number; uncertainty: number; eig: number }[];
+  difficultyPattern: { step: number; difficulty: number; ability: number; correct: number }[];
+  radarData: { concept: string; fullName: string; mastery: number }[];
+  mode: LearningMode;
+  sessionStats: { total: number; correct: number };
+  stepRecords: StepRecord[];
+}
+
+// Right-hand analytics panel. Memoized so that selecting an answer or
+// toggling the hint re-renders only the question card. The selected tab is
+// owned by Learn: the loading spinner unmounts this panel on every concept or
+// mode switch, and the tab should survive that.
+const AnalyticsPanel = memo(function AnalyticsPanel({
+  activeTab, onTabChange, brainState, beliefDistData, convergenceData,
+  difficultyPattern, radarData, mode, sessionStats, stepRecords,
+}: AnalyticsPanelProps) {
+  return (
+    <div className="space-y-3">
+      {/* Tab Switcher */}
+      <div className="flex bg-white/70 border border-white/80 rounded-xl p-0.5">
+        {[
+          { id: 'inference' as const, label: 'Active Inference', icon: Brain },
+          { id: 'knowledge' as const, label: 'Knowledge', icon: BarChart3 },
+          { id: 'stats' as const, label: 'Session', icon: TrendingUp },
+        ].map(tab => {
+          const Icon = tab.icon;
+          return (
+            <button
+              key={tab.id}
+              onClick={() => onTabChange(tab.id)}
+              className={cn(
+                'flex-1 flex items-center justify-center gap-1.5 px-2 py-1.5 rounded-lg text-[11px] font-medium transition-all',
+                activeTab === tab.id ? 'bg-blue-500 text-white shadow-sm' : 'text-muted-foreground hover:text-foreground'
+              )}
+            >
+              <Icon size={12} /> {tab.label}
+            </button>
+          );
+        })}
+      </div>
+
+      {/* Tab Content */}
+      {activeTab === 'inference' && (
+        <div className="space-y-3">
+          {/* Posterior Belief Distribution */}
+          <GlassCard hover={false} className="p-4">
+            <h3 className="text-xs font-semibold text-foreground mb-1 flex items-center gap-1.5">
+              <Activity size={14} className="text-purple-500" />
+              Posterior Belief Distribution
+            </h3>
+            <p className="text-[10px] text-muted-foreground mb-2">
+              P(ability | observations) — The model's belief about your ability level
+            </p>
+            <div className="h-[180px]">
+              <ResponsiveContainer width="100%" height="100%">
+                <AreaChart data={beliefDistData}>
+                  <defs>
+                    <linearGradient id="beliefGrad" x1="0" y1="0" x2="0" y2="1">
+                      <stop offset="5%" stopColor="#8B5CF6" stopOpacity={0.3} />
+                      <stop offset="95%" stopColor="#8B5CF6" stopOpacity={0} />
+                    </linearGradient>
+                  </defs>
+                  <CartesianGrid strokeDasharray="3 3" stroke="rgba(139,92,246,0.08)" />
+                  <XAxis dataKey="ability" tick={axisTick} label={{ value: 'Ability (%)', position: 'insideBottom', offset: -2, fontSize: 9, fill: '#94a3b8' }} />
+                  <YAxis tick={axisTick} label={{ value: 'P(θ)', angle: -90, position: 'insideLeft', fontSize: 9, fill: '#94a3b8' }} />
+                  <Tooltip
+                    contentStyle={tooltipStyle}
+                    formatter={(value: number) => [`${value}%`, 'Probability']}
+                    labelFormatter={(label) => `Ability: ${label}%`}
+                  />
+                  {brainState && (
+                    <ReferenceLine x={Math.round(brainState.estimatedAbility * 100)} stroke="#3B82F6" strokeDasharray="5 5" label={{ value: 'θ̂', position: 'top', fontSize: 10, fill: '#3B82F6' }} />
+                  )}
+                  <Area type="monotone" dataKey="probability" stroke="#8B5CF6" fill="url(#beliefGrad)" strokeWidth={2} />
+                </AreaChart>
+              </ResponsiveContainer>
+            </div>
+          </GlassCard>
+
+          {/* Ability Convergence + Entropy */}
+          {convergenceData.length > 0 && (
+            <GlassCard hover={false} className="p-4">
+              <h3 className="text-xs font-semibold text-foreground mb-1 flex items-center gap-1.5">
+                <TrendingUp size={14} className="text-blue-500" />
+                Ability Convergence & Entropy
+              </h3>
+              <p className="text-[10px] text-muted-foreground mb-2">
+                How ability estimate stabilizes while uncertainty decreases
+              </p>
+              <div className="h-[200px]">
+                <ResponsiveContainer width="100%" height="100%">
+                  <LineChart data={convergenceData}>
+                    <CartesianGrid strokeDasharray="3 3" stroke="rgba(59,130,246,0.08)" />
+                    <XAxis dataKey="step" tick={axisTick} label={{ value: 'Question #', position: 'insideBottom', offset: -2, fontSize: 9, fill: '#94a3b8' }} />
+                    <YAxis yAxisId="left" domain={[0, 100]} tick={axisTick} />
+                    <YAxis yAxisId="right" orientation="right" tick={axisTick} />
+                    <Tooltip
+                      contentStyle={tooltipStyle}
+                    />
+                    <Legend wrapperStyle={{ fontSize: '10px' }} />
+                    <Line yAxisId="left" type="monotone" dataKey="ability" stroke="#3B82F6" strokeWidth={2} dot={{ r: 3, fill: '#3B82F6' }} name="Ability (%)" />
+                    <Line yAxisId="right" type="monotone" dataKey="uncertainty" stroke="#F59E0B" strokeWidth={2} dot={{ r: 3, fill: '#F59E0B' }} name="Entropy (bits)" strokeDasharray="5 5" />
+                  </LineChart>
+                </ResponsiveContainer>
+              </div>
+            </GlassCard>
+          )}
+
+          {/* EIG per Question */}
+          {convergenceData.length > 0 && (
+            <GlassCard hover={false} className="p-4">
+              <h3 className="text-xs font-semibold text-foreground mb-1 flex items-center gap-1.5">
+                <Zap size={14} className="text-amber-500" />
+                Expected Information Gain (EIG) per Question
+              </h3>
+              <p className="text-[10px] text-muted-foreground mb-2">
+                How much information each question provides about your ability
+              </p>
+              <div className="h-[160px]">
+                <ResponsiveContainer width="100%" height="100%">
+                  <BarChart data={convergenceData}>
+                    <CartesianGrid strokeDasharray="3 3" stroke="rgba(245,158,11,0.08)" />
+                    <XAxis dataKey="step" tick={axisTick} />
+                    <YAxis tick={axisTick} />
+                    <Tooltip
+                      contentStyle={tooltipStyle}
+                      formatter={(value: number) => [value.toFixed(3), 'EIG (bits)']}
+                    />
+                    <Bar dataKey="eig" fill="#F59E0B" radius={[4, 4, 0, 0]} name="EIG" />
+                  </BarChart>
+                </ResponsiveContainer>
+              </div>
+            </GlassCard>
+          )}
+
+          {/* Difficulty Adaptation Pattern */}
+          {difficultyPattern.length > 0 && (
+            <GlassCard hover={false} className="p-4">
+              <h3 className="text-xs font-semibold text-foreground mb-1 flex items-center gap-1.5">
+                <Target size={14} className="text-emerald-500" />
+                Difficulty Adaptation Pattern
+              </h3>
+              <p className="text-[10px] text-muted-foreground mb-2">
+                How question difficulty adapts to match your ability level
+              </p>
+              <div className="h-[180px]">
+                <ResponsiveContainer width="100%" height="100%">
+                  <LineChart data={difficultyPattern}>
+                    <CartesianGrid strokeDasharray="3 3" stroke="rgba(16,185,129,0.08)" />
+                    <XAxis dataKey="step" tick={axisTick} label={{ value: 'Question #', position: 'insideBottom', offset: -2, fontSize: 9, fill: '#94a3b8' }} />
+                    <YAxis domain={[0, 100]} tick={axisTick} />
+                    <Tooltip
+                      contentStyle={tooltipStyle}
+                    />
+                    <Legend wrapperStyle={{ fontSize: '10px' }} />
+                    <Line type="monotone" dataKey="difficulty" stroke="#10B981" strokeWidth={2} dot={(props: any) => {
+                      const { cx, cy, payload } = props;
+                      return (
+                        <circle
+                          key={`dot-${payload.step}`}
+                          cx={cx}
+                          cy={cy}
+                          r={4}
+                          fill={payload.correct ? '#10B981' : '#EF4444'}
+                          stroke="white"
+                          strokeWidth={1.5}
+                        />
+                      );
+                    }} name="Difficulty (%)" />
+                    <Line type="monotone" dataKey="ability" stroke="#3B82F6" strokeWidth={2} strokeDasharray="5 5" dot={false} name="Ability (%)" />
+                  </LineChart>
+                </ResponsiveContainer>
+              </div>
+              <div className="flex items-center gap-4 mt-2 text-[10px] text-muted-foreground">
+                <div className="flex items-center gap-1">
+                  <div className="w-2.5 h-2.5 rounded-full bg-emerald-500" /> Correct
+                </div>
+                <div className="flex items-center gap-1">
+                  <div className="w-2.5 h-2.5 rounded-full bg-red-500" /> Incorrect
+                </div>
+              </div>
+            </GlassCard>
+          )}
+        </div>
+      )}
+
+      {activeTab === 'knowledge' && (
+        <div className="space-y-3">
+          {/* Knowledge Radar */}
+          <GlassCard hover={false} className="p-4">
+            <h3 className="text-xs font-semibold text-foreground mb-2 flex items-center gap-1.5">
+              <BarChart3 size={14} className="text-blue-500" />
+              Knowledge Radar
+            </h3>
+            <div className="h-[280px]">
+              <ResponsiveContainer width="100%" height="100%">
+                <RadarChart data={radarData} cx="50%" cy="50%" outerRadius="70%">
+                  <PolarGrid stroke="rgba(59,130,246,0.15)" />
+                  <PolarAngleAxis dataKey="concept" tick={{ fontSize: 9, fill: '#64748b' }} />
+                  <PolarRadiusAxis angle={30} domain={[0, 100]} tick={{ fontSize: 8, fill: '#94a3b8' }} />
+                  <Radar name="Mastery" dataKey="mastery" stroke="#3B82F6" fill="#3B82F6" fillOpacity={0.2} strokeWidth={2} />
+                  <Tooltip
+                    contentStyle={tooltipStyle}
+                    formatter={(value: number) => [`${value}%`, 'Mastery']}
+                  />
+                </RadarChart>
+              </ResponsiveContainer>
+            </div>
+          </GlassCard>
+
+          {/* Concept Breakdown */}
+          <GlassCard hover={false} className="p-4">
+            <h3 className="text-xs font-semibold text-foreground mb-3">Concept Mastery Breakdown</h3>
+            <div className="space-y-2">
+              {radarData.map(d => (
+                <div key={d.fullName}>
+                  <div className="flex justify-between text-[11px] mb-0.5">
+                    <span className="text-muted-foreground truncate mr-2">{d.fullName}</span>
+                    <span className="font-medium text-foreground">{d.mastery}%</span>
+                  </div>
+                  <div className="h-1.5 bg-blue-50 rounded-full overflow-hidden">
+                    <motion.div
+                      className="h-full rounded-full"
+                      style={{ background: d.mastery >= 80 ? '#10B981' : d.mastery >= 50 ? '#3B82F6' : '#F59E0B' }}
+                      initial={{ width: 0 }}
+                      animate={{ width: `${d.mastery}%` }}
+                      transition={{ duration: 0.6 }}
+                    />
+                  </div>
+                </div>
+              ))}
+            </div>
+          </GlassCard>
+        </div>
+      )}
+
+      {activeTab === 'stats' && (
+        <div className="space-y-3">
+          {/* Session Stats */}
+          <GlassCard hover={false} className="p-4">
+            <h3 className="text-xs font-semibold text-foreground mb-3">
+              Session Statistics ({mode === 'adaptive' ? 'Adaptive' : 'Fixed'})
+            </h3>
+            <div className="grid grid-cols-3 gap-2 text-center">
+              <div className="p-3 rounded-lg bg-blue-50/50">
+                <p className="text-2xl font-bold text-blue-600">{sessionStats.total}</p>
+                <p className="text-[10px] text-muted-foreground">Answered</p>
+              </div>
+              <div className="p-3 rounded-lg bg-emerald-50/50">
+                <p className="text-2xl font-bold text-emerald-600">{sessionStats.correct}</p>
+                <p className="text-[10px] text-muted-foreground">Correct</p>
+              </div>
+              <div className="p-3 rounded-lg bg-amber-50/50">
+                <p className="text-2xl font-bold text-amber-600">
+                  {sessionStats.total > 0 ? Math.round((sessionStats.correct / sessionStats.total) * 100) : 0}%
+                </p>
+                <p className="text-[10px] text-muted-foreground">Accuracy</p>
+              </div>
+            </div>
+          </GlassCard>
+
+          {/* Answer History */}
+          {stepRecords.length > 0 && (
+            <GlassCard hover={false} className="p-4">
+              <h3 className="text-xs font-semibold text-foreground mb-3">Answer History</h3>
+              <div className="space-y-1.5 max-h-[400px] overflow-y-auto">
+                {stepRecords.map((r, i) => (
+                  <div key={i} className={cn(
+                    'flex items-center gap-2 px-3 py-2 rounded-lg text-[11px]',
+                    r.correct ? 'bg-emerald-50/50' : 'bg-red-50/50'
+                  )}>
+                    <span className="font-mono text-muted-foreground w-5">#{r.step}</span>
+                    <span className={cn('font-medium', r.correct ? 'text-emerald-600' : 'text-red-600')}>
+                      {r.correct ? '✓' : '✗'}
+                    </span>
+                    <span className="text-muted-foreground truncate flex-1">{r.concept}</span>
+                    <span className="text-muted-foreground">D:{Math.round(r.difficulty * 100)}%</span>
+                    <span className="text-blue-600 font-medium">θ:{r.ability}%</span>
+                  </div>
+                ))}
+              </div>
+            </GlassCard>
+          )}
+        </div>
+      )}
+    </div>
+  );
+});
+
 export default function Learn() {
-  const { user, refreshProfile } = useAuth();
+  const { user, profile, refreshProfile } = useAuth();
   const [brainState, setBrainState] = useState<BrainState | null>(null);
   const [currentQuestion, setCurrentQuestion] = useState<Question | null>(null);
   const [selectedAnswer, setSelectedAnswer] = useState<string | null>(null);
@@ -43,18 +365,16 @@ export default function Learn() {
   const [isCorrect, setIsCorrect] = useState(false);
   const [selectedConcept, setSelectedConcept] = useState<string>('all');
   const [answeredIds, setAnsweredIds] = useState<number[]>([]);
+  const answeredSet = useMemo(() => new Set(answeredIds), [answeredIds]);
   const [sessionStats, setSessionStats] = useState({ total: 0, correct: 0 });
   const [stepRecords, setStepRecords] = useState<StepRecord[]>([]);
-  const [currentEIG, setCurrentEIG] = useState<number>(0);
+  const [activeTab, setActiveTab] = useState<AnalyticsTab>('inference');
   const startTime = useRef(Date.now());
 
   // Mode
   const [mode, setMode] = useState<LearningMode>('adaptive');
   const [fixedIndex, setFixedIndex] = useState(0);
 
-  // Active tab for right panel
-  const [activeTab, setActiveTab] = useState<'inference' | 'knowledge' | 'stats'>('inference');
-
   useEffect(() => {
     if (!user) return;
     const profile = getUserProfile(user);
@@ -70,26 +390,23 @@ export default function Learn() {
     if (brainState && !currentQuestion) pickNext();
   }, [brainState]);
 
-  // Compute EIG for current question
-  useEffect(() => {
-    if (brainState && currentQuestion && mode === 'adaptive') {
-      const eig = expectedInformationGain(brainState.belief, currentQuestion);
-      setCurrentEIG(eig);
-    } else {
-      setCurrentEIG(0);
-    }
-  }, [brainState, currentQuestion, mode]);
+  // EIG for the current question, derived during render rather than set from
+  // an effect (which cost a second render), and reused when it is answered
+  const currentEIG = useMemo(() => (
+    brainState && currentQuestion && mode === 'adaptive'
+      ? expectedInformationGain(brainState.belief, currentQuestion)
+      : 0
+  ), [brainState, currentQuestion, mode]);
 
   const getFilteredQuestions = (concept?: string) => {
     const c = concept ?? selectedConcept;
-    return c === 'all' ? [...questions] : questions.filter(q => q.concept === c);
+    return c === 'all' ? questions : getQuestionsByConceptMap()[c] ?? [];
   };
 
   const pickNext = () => {
     if (!brainState) return;
     if (mode === 'adaptive') {
-      let available = questions.filter(q => !answeredIds.includes(q.id));
-      if (selectedConcept !== 'all') available = available.filter(q => q.concept === selectedConcept);
+      let available = getFilteredQuestions().filter(q => !answeredSet.has(q.id));
       if (available.length === 0) {
         setAnsweredIds([]);
         available = getFilteredQuestions();
@@ -118,7 +435,7 @@ export default function Learn() {
     setIsCorrect(correct);
 
     const timeSpent = Math.round((Date.now() - startTime.current) / 1000);
-    const eigBefore = mode === 'adaptive' ? expectedInformationGain(brainState.belief, currentQuestion) : 0;
+    const eigBefore = currentEIG;
     const newBrain = updateBelief(brainState, currentQuestion, correct);
     setBrainState(newBrain);
 
@@ -133,31 +450,30 @@ export default function Learn() {
       concept: currentQuestion.concept,
     }]);
 
-    // Save brain state
-    const profile = getUserProfile(user);
-    if (profile) {
-      profile.brainState = newBrain;
-      saveUserProfile(profile);
-    }
-
-    const { xpGained, newAchievements } = recordAnswer(
-      user, currentQuestion, answer, correct, timeSpent,
-      mode,
-      newBrain.estimatedAbility,
-      newBrain.belief.reduce((s: number, p: number) => s - (p > 0 ? p * Math.log2(p) : 0), 0)
-    );
     setAnsweredIds(prev => [...prev, currentQuestion!.id]);
     setSessionStats(prev => ({
       total: prev.total + 1,
       correct: prev.correct + (correct ? 1 : 0),
     }));
 
-    if (!correct) addToReview(user, currentQuestion.id);
-    if (xpGained > 0) toast.success(`+${xpGained} XP`, { duration: 1500 });
-    for (const ach of newAchievements) {
-      toast(`Achievement Unlocked: ${ach.name}`, { description: ach.description, duration: 3000 });
-    }
-    refreshProfile();
+    // Persisting re-serializes every stored profile, so it is deferred to its
+    // own task and the result state above commits without waiting on it.
+    const question = currentQuestion;
+    setTimeout(() => {
+      const { xpGained, newAchievements } = recordAnswer(
+        user, question, answer, correct, timeSpent,
+        mode,
+        newBrain.estimatedAbility,
+        newBrain.uncertainty,
+        { brainState: newBrain, queueReview: true }
+      );
+
+      if (xpGained > 0) toast.success(`+${xpGained} XP`, { duration: 1500 });
+      for (const ach of newAchievements) {
+        toast(`Achievement Unlocked: ${ach.name}`, { description: ach.description, duration: 3000 });
+      }
+      refreshProfile();
+    }, 0);
   };
 
   const handleNext = () => pickNext();
@@ -171,12 +487,11 @@ export default function Learn() {
     setTimeout(() => {
       if (brainState) {
         if (mode === 'adaptive') {
-          let available = questions.filter(q => !answeredIds.includes(q.id));
-          if (concept !== 'all') available = available.filter(q => q.concept === concept);
-          if (available.length === 0) available = concept === 'all' ? [...questions] : questions.filter(q => q.concept === concept);
+          let available = getFilteredQuestions(concept).filter(q => !answeredSet.has(q.id));
+          if (available.length === 0) available = getFilteredQuestions(concept);
           setCurrentQuestion(selectNextQuestion(brainState, available));
         } else {
-          const pool = concept === 'all' ? [...questions] : questions.filter(q => q.concept === concept);
+          const pool = getFilteredQuestions(concept);
           if (pool.length > 0) { setCurrentQuestion(pool[0]); setFixedIndex(1); }
         }
         startTime.current = Date.now();
@@ -196,8 +511,7 @@ export default function Learn() {
     setTimeout(() => {
       if (brainState) {
         if (newMode === 'adaptive') {
-          let available = questions.filter(q => !answeredIds.includes(q.id));
-          if (selectedConcept !== 'all') available = available.filter(q => q.concept === selectedConcept);
+          let available = getFilteredQuestions().filter(q => !answeredSet.has(q.id));
           if (available.length === 0) available = getFilteredQuestions();
           setCurrentQuestion(selectNextQuestion(brainState, available));
         } else {
@@ -212,23 +526,31 @@ export default function Learn() {
   // Belief distribution data for visualization
   const beliefDistData = useMemo(() => {
     if (!brainState) return [];
-    return ABILITY_GRID.map((ability, i) => ({
-      ability: Math.round(ability * 100),
+    return ABILITY_PERCENT.map((ability, i) => ({
+      ability,
       probability: Math.round(brainState.belief[i] * 10000) / 100,
     }));
   }, [brainState]);
 
   // Concept mastery from profile
-  const profile = user ? getUserProfile(user) : null;
+  // The profile reloads after every answer, but the rounded masteries
+  // usually stay put; keying the memo on them keeps the radar from redrawing.
+  // The memo only reruns when the key changes, i.e. with this render's masteries.
+  const masteries = profile
+    ? CONCEPTS.map(concept => {
+        const s = profile.stats.conceptStats[concept];
+        return s && s.total > 0 ? Math.round((s.correct / s.total) * 100) : 0;
+      })
+    : null;
+  const masteryKey = masteries ? masteries.join(',') : '';
   const radarData = useMemo(() => {
-    if (!profile) return [];
-    const stats = profile.stats.conceptStats;
-    return CONCEPTS.map(concept => {
-      const s = stats[concept];
-      const mastery = s && s.total > 0 ? Math.round((s.correct / s.total) * 100) : 0;
-      return { concept: concept.length > 10 ? concept.slice(0, 8) + '...' : concept, fullName: concept, mastery };
-    });
-  }, [profile]);
+    if (!masteries) return [];
+    return CONCEPTS.map((concept, i) => ({
+      concept: concept.length > 10 ? concept.slice(0, 8) + '...' : concept,
+      fullName: concept,
+      mastery: masteries[i],
+    }));
+  }, [masteryKey]);
 
   // Convergence + entropy data
   const convergenceData = useMemo(() => {
@@ -268,8 +590,7 @@ export default function Learn() {
     { key: 'D', text: currentQuestion.option_d },
   ];
 
-  const difficultyLabel = currentQuestion.difficulty < 0.3 ? 'Easy' : currentQuestion.difficulty < 0.6 ? 'Medium' : 'Hard';
-  const difficultyColor = currentQuestion.difficulty < 0.3 ? 'text-emerald-500 bg-emerald-50' : currentQuestion.difficulty < 0.6 ? 'text-amber-500 bg-amber-50' : 'text-red-500 bg-red-50';
+  const difficultyBadge = getDifficultyBadge(currentQuestion.difficulty);
 
   return (
     <div className="space-y-4">
@@ -404,8 +725,8 @@ export default function Learn() {
                   <span className="text-xs font-medium px-2.5 py-1 rounded-lg bg-blue-50 text-blue-600">
                     {currentQuestion.concept}
                   </span>
-                  <span className={cn('text-xs font-medium px-2.5 py-1 rounded-lg', difficultyColor)}>
-                    {difficultyLabel} ({Math.round(currentQuestion.difficulty * 100)}%)
+                  <span className={cn('text-xs font-medium px-2.5 py-1 rounded-lg', difficultyBadge.className)}>
+                    {difficultyBadge.label} ({Math.round(currentQuestion.difficulty * 100)}%)
                   </span>
                   <span className={cn(
                     'text-xs font-medium px-2.5 py-1 rounded-lg',
@@ -500,275 +821,18 @@ export default function Learn() {
         </div>
 
         {/* Right: Analytics Panel with Tabs */}
-        <div className="space-y-3">
-          {/* Tab Switcher */}
-          <div className="flex bg-white/70 border border-white/80 rounded-xl p-0.5">
-            {[
-              { id: 'inference' as const, label: 'Active Inference', icon: Brain },
-              { id: 'knowledge' as const, label: 'Knowledge', icon: BarChart3 },
-              { id: 'stats' as const, label: 'Session', icon: TrendingUp },
-            ].map(tab => {
-              const Icon = tab.icon;
-              return (
-                <button
-                  key={tab.id}
-                  onClick={() => setActiveTab(tab.id)}
-                  className={cn(
-                    'flex-1 flex items-center justify-center gap-1.5 px-2 py-1.5 rounded-lg text-[11px] font-medium transition-all',
-                    activeTab === tab.id ? 'bg-blue-500 text-white shadow-sm' : 'text-muted-foreground hover:text-foreground'
-                  )}
-                >
-                  <Icon size={12} /> {tab.label}
-                </button>
-              );
-            })}
-          </div>
-
-          {/* Tab Content */}
-          {activeTab === 'inference' && (
-            <div className="space-y-3">
-              {/* Posterior Belief Distribution */}
-              <GlassCard hover={false} className="p-4">
-                <h3 className="text-xs font-semibold text-foreground mb-1 flex items-center gap-1.5">
-                  <Activity size={14} className="text-purple-500" />
-                  Posterior Belief Distribution
-                </h3>
-                <p className="text-[10px] text-muted-foreground mb-2">
-                  P(ability | observations) — The model's belief about your ability level
-                </p>
-                <div className="h-[180px]">
-                  <ResponsiveContainer width="100%" height="100%">
-                    <AreaChart data={beliefDistData}>
-                      <defs>
-                        <linearGradient id="beliefGrad" x1="0" y1="0" x2="0" y2="1">
-                          <stop offset="5%" stopColor="#8B5CF6" stopOpacity={0.3} />
-                          <stop offset="95%" stopColor="#8B5CF6" stopOpacity={0} />
-                        </linearGradient>
-                      </defs>
-                      <CartesianGrid strokeDasharray="3 3" stroke="rgba(139,92,246,0.08)" />
-                      <XAxis dataKey="ability" tick={{ fontSize: 9, fill: '#94a3b8' }} label={{ value: 'Ability (%)', position: 'insideBottom', offset: -2, fontSize: 9, fill: '#94a3b8' }} />
-                      <YAxis tick={{ fontSize: 9, fill: '#94a3b8' }} label={{ value: 'P(θ)', angle: -90, position: 'insideLeft', fontSize: 9, fill: '#94a3b8' }} />
-                      <Tooltip
-                        contentStyle={{ background: 'rgba(255,255,255,0.95)', backdropFilter: 'blur(8px)', border: '1px solid rgba(255,255,255,0.8)', borderRadius: '10px', fontSize: '11px' }}
-                        formatter={(value: number) => [`${value}%`, 'Probability']}
-                        labelFormatter={(label) => `Ability: ${label}%`}
-                      />
-                      {brainState && (
-                        <ReferenceLine x={Math.round(brainState.estimatedAbility * 100)} stroke="#3B82F6" strokeDasharray="5 5" label={{ value: 'θ̂', position: 'top', fontSize: 10, fill: '#3B82F6' }} />
-                      )}
-                      <Area type="monotone" dataKey="probability" stroke="#8B5CF6" fill="url(#beliefGrad)" strokeWidth={2} />
-                    </AreaChart>
-                  </ResponsiveContainer>
-                </div>
-              </GlassCard>
-
-              {/* Ability Convergence + Entropy */}
-              {convergenceData.length > 0 && (
-                <GlassCard hover={false} className="p-4">
-                  <h3 className="text-xs font-semibold text-foreground mb-1 flex items-center gap-1.5">
-                    <TrendingUp size={14} className="text-blue-500" />
-                    Ability Convergence & Entropy
-                  </h3>
-                  <p className="text-[10px] text-muted-foreground mb-2">
-                    How ability estimate stabilizes while uncertainty decreases
-                  </p>
-                  <div className="h-[200px]">
-                    <ResponsiveContainer width="100%" height="100%">
-                      <LineChart data={convergenceData}>
-                        <CartesianGrid strokeDasharray="3 3" stroke="rgba(59,130,246,0.08)" />
-                        <XAxis dataKey="step" tick={{ fontSize: 9, fill: '#94a3b8' }} label={{ value: 'Question #', position: 'insideBottom', offset: -2, fontSize: 9, fill: '#94a3b8' }} />
-                        <YAxis yAxisId="left" domain={[0, 100]} tick={{ fontSize: 9, fill: '#94a3b8' }} />
-                        <YAxis yAxisId="right" orientation="right" tick={{ fontSize: 9, fill: '#94a3b8' }} />
-                        <Tooltip
-                          contentStyle={{ background: 'rgba(255,255,255,0.95)', backdropFilter: 'blur(8px)', border: '1px solid rgba(255,255,255,0.8)', borderRadius: '10px', fontSize: '11px' }}
-                        />
-                        <Legend wrapperStyle={{ fontSize: '10px' }} />
-                        <Line yAxisId="left" type="monotone" dataKey="ability" stroke="#3B82F6" strokeWidth={2} dot={{ r: 3, fill: '#3B82F6' }} name="Ability (%)" />
-                        <Line yAxisId="right" type="monotone" dataKey="uncertainty" stroke="#F59E0B" strokeWidth={2} dot={{ r: 3, fill: '#F59E0B' }} name="Entropy (bits)" strokeDasharray="5 5" />
-                      </LineChart>
-                    </ResponsiveContainer>
-                  </div>
-                </GlassCard>
-              )}
-
-              {/* EIG per Question */}
-              {convergenceData.length > 0 && (
-                <GlassCard hover={false} className="p-4">
-                  <h3 className="text-xs font-semibold text-foreground mb-1 flex items-center gap-1.5">
-                    <Zap size={14} className="text-amber-500" />
-                    Expected Information Gain (EIG) per Question
-                  </h3>
-                  <p className="text-[10px] text-muted-foreground mb-2">
-                    How much information each question provides about your ability
-                  </p>
-                  <div className="h-[160px]">
-                    <ResponsiveContainer width="100%" height="100%">
-                      <BarChart data={convergenceData}>
-                        <CartesianGrid strokeDasharray="3 3" stroke="rgba(245,158,11,0.08)" />
-                        <XAxis dataKey="step" tick={{ fontSize: 9, fill: '#94a3b8' }} />
-                        <YAxis tick={{ fontSize: 9, fill: '#94a3b8' }} />
-                        <Tooltip
-                          contentStyle={{ background: 'rgba(255,255,255,0.95)', backdropFilter: 'blur(8px)', border: '1px solid rgba(255,255,255,0.8)', borderRadius: '10px', fontSize: '11px' }}
-                          formatter={(value: number) => [value.toFixed(3), 'EIG (bits)']}
-                        />
-                        <Bar dataKey="eig" fill="#F59E0B" radius={[4, 4, 0, 0]} name="EIG" />
-                      </BarChart>
-                    </ResponsiveContainer>
-                  </div>
-                </GlassCard>
-              )}
-
-              {/* Difficulty Adaptation Pattern */}
-              {difficultyPattern.length > 0 && (
-                <GlassCard hover={false} className="p-4">
-                  <h3 className="text-xs font-semibold text-foreground mb-1 flex items-center gap-1.5">
-                    <Target size={14} className="text-emerald-500" />
-                    Difficulty Adaptation Pattern
-                  </h3>
-                  <p className="text-[10px] text-muted-foreground mb-2">
-                    How question difficulty adapts to match your ability level
-                  </p>
-                  <div className="h-[180px]">
-                    <ResponsiveContainer width="100%" height="100%">
-                      <LineChart data={difficultyPattern}>
-                        <CartesianGrid strokeDasharray="3 3" stroke="rgba(16,185,129,0.08)" />
-                        <XAxis dataKey="step" tick={{ fontSize: 9, fill: '#94a3b8' }} label={{ value: 'Question #', position: 'insideBottom', offset: -2, fontSize: 9, fill: '#94a3b8' }} />
-                        <YAxis domain={[0, 100]} tick={{ fontSize: 9, fill: '#94a3b8' }} />
-                        <Tooltip
-                          contentStyle={{ background: 'rgba(255,255,255,0.95)', backdropFilter: 'blur(8px)', border: '1px solid rgba(255,255,255,0.8)', borderRadius: '10px', fontSize: '11px' }}
-                        />
-                        <Legend wrapperStyle={{ fontSize: '10px' }} />
-                        <Line type="monotone" dataKey="difficulty" stroke="#10B981" strokeWidth={2} dot={(props: any) => {
-                          const { cx, cy, payload } = props;
-                          return (
-                            <circle
-                              key={`dot-${payload.step}`}
-                              cx={cx}
-                              cy={cy}
-                              r={4}
-                              fill={payload.correct ? '#10B981' : '#EF4444'}
-                              stroke="white"
-                              strokeWidth={1.5}
-                            />
-                          );
-                        }} name="Difficulty (%)" />
-                        <Line type="monotone" dataKey="ability" stroke="#3B82F6" strokeWidth={2} strokeDasharray="5 5" dot={false} name="Ability (%)" />
-                      </LineChart>
-                    </ResponsiveContainer>
-                  </div>
-                  <div className="flex items-center gap-4 mt-2 text-[10px] text-muted-foreground">
-                    <div className="flex items-center gap-1">
-                      <div className="w-2.5 h-2.5 rounded-full bg-emerald-500" /> Correct
-                    </div>
-                    <div className="flex items-center gap-1">
-                      <div className="w-2.5 h-2.5 rounded-full bg-red-500" /> Incorrect
-                    </div>
-                  </div>
-                </GlassCard>
-              )}
-            </div>
-          )}
-
-          {activeTab === 'knowledge' && (
-            <div className="space-y-3">
-              {/* Knowledge Radar */}
-              <GlassCard hover={false} className="p-4">
-                <h3 className="text-xs font-semibold text-foreground mb-2 flex items-center gap-1.5">
-                  <BarChart3 size={14} className="text-blue-500" />
-                  Knowledge Radar
-                </h3>
-                <div className="h-[280px]">
-                  <ResponsiveContainer width="100%" height="100%">
-                    <RadarChart data={radarData} cx="50%" cy="50%" outerRadius="70%">
-                      <PolarGrid stroke="rgba(59,130,246,0.15)" />
-                      <PolarAngleAxis dataKey="concept" tick={{ fontSize: 9, fill: '#64748b' }} />
-                      <PolarRadiusAxis angle={30} domain={[0, 100]} tick={{ fontSize: 8, fill: '#94a3b8' }} />
-                      <Radar name="Mastery" dataKey="mastery" stroke="#3B82F6" fill="#3B82F6" fillOpacity={0.2} strokeWidth={2} />
-                      <Tooltip
-                        contentStyle={{ background: 'rgba(255,255,255,0.95)', backdropFilter: 'blur(8px)', border: '1px solid rgba(255,255,255,0.8)', borderRadius: '10px', fontSize: '11px' }}
-                        formatter={(value: number) => [`${value}%`, 'Mastery']}
-                      />
-                    </RadarChart>
-                  </ResponsiveContainer>
-                </div>
-              </GlassCard>
-
-              {/* Concept Breakdown */}
-              <GlassCard hover={false} className="p-4">
-                <h3 className="text-xs font-semibold text-foreground mb-3">Concept Mastery Breakdown</h3>
-                <div className="space-y-2">
-                  {radarData.map(d => (
-                    <div key={d.fullName}>
-                      <div className="flex justify-between text-[11px] mb-0.5">
-                        <span className="text-muted-foreground truncate mr-2">{d.fullName}</span>
-                        <span className="font-medium text-foreground">{d.mastery}%</span>
-                      </div>
-                      <div className="h-1.5 bg-blue-50 rounded-full overflow-hidden">
-                        <motion.div
-                          className="h-full rounded-full"
-                          style={{ background: d.mastery >= 80 ? '#10B981' : d.mastery >= 50 ? '#3B82F6' : '#F59E0B' }}
-                          initial={{ width: 0 }}
-                          animate={{ width: `${d.mastery}%` }}
-                          transition={{ duration: 0.6 }}
-                        />
-                      </div>
-                    </div>
-                  ))}
-                </div>
-              </GlassCard>
-            </div>
-          )}
-
-          {activeTab === 'stats' && (
-            <div className="space-y-3">
-              {/* Session Stats */}
-              <GlassCard hover={false} className="p-4">
-                <h3 className="text-xs font-semibold text-foreground mb-3">
-                  Session Statistics ({mode === 'adaptive' ? 'Adaptive' : 'Fixed'})
-                </h3>
-                <div className="grid grid-cols-3 gap-2 text-center">
-                  <div className="p-3 rounded-lg bg-blue-50/50">
-                    <p className="text-2xl font-bold text-blue-600">{sessionStats.total}</p>
-                    <p className="text-[10px] text-muted-foreground">Answered</p>
-                  </div>
-                  <div className="p-3 rounded-lg bg-emerald-50/50">
-                    <p className="text-2xl font-bold text-emerald-600">{sessionStats.correct}</p>
-                    <p className="text-[10px] text-muted-foreground">Correct</p>
-                  </div>
-                  <div className="p-3 rounded-lg bg-amber-50/50">
-                    <p className="text-2xl font-bold text-amber-600">
-                      {sessionStats.total > 0 ? Math.round((sessionStats.correct / sessionStats.total) * 100) : 0}%
-                    </p>
-                    <p className="text-[10px] text-muted-foreground">Accuracy</p>
-                  </div>
-                </div>
-              </GlassCard>
-
-              {/* Answer History */}
-              {stepRecords.length > 0 && (
-                <GlassCard hover={false} className="p-4">
-                  <h3 className="text-xs font-semibold text-foreground mb-3">Answer History</h3>
-                  <div className="space-y-1.5 max-h-[400px] overflow-y-auto">
-                    {stepRecords.map((r, i) => (
-                      <div key={i} className={cn(
-                        'flex items-center gap-2 px-3 py-2 rounded-lg text-[11px]',
-                        r.correct ? 'bg-emerald-50/50' : 'bg-red-50/50'
-                      )}>
-                        <span className="font-mono text-muted-foreground w-5">#{r.step}</span>
-                        <span className={cn('font-medium', r.correct ? 'text-emerald-600' : 'text-red-600')}>
-                          {r.correct ? '✓' : '✗'}
-                        </span>
-                        <span className="text-muted-foreground truncate flex-1">{r.concept}</span>
-                        <span className="text-muted-foreground">D:{Math.round(r.difficulty * 100)}%</span>
-                        <span className="text-blue-600 font-medium">θ:{r.ability}%</span>
-                      </div>
-                    ))}
-                  </div>
-                </GlassCard>
-              )}
-            </div>
-          )}
-        </div>
+        <AnalyticsPanel
+          activeTab={activeTab}
+          onTabChange={setActiveTab}
+          brainState={brainState}
+          beliefDistData={beliefDistData}
+          convergenceData={convergenceData}
+          difficultyPattern={difficultyPattern}
+          radarData={radarData}
+          mode={mode}
+          sessionStats={sessionStats}
+          stepRecords={stepRecords}
+        />
       </div>
     </div>
   );
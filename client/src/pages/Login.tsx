@@ -9,6 +9,22 @@ import { useLocation } from 'wouter';
 
 const HERO_IMG = '';
 
+// Static per-account styling, kept out of the component since the form
+// re-renders on every keystroke.
+const LEVEL_COLORS: Record<string, string> = {
+  'Alice': 'from-blue-500 to-cyan-500',
+  'Bob': 'from-amber-500 to-orange-500',
+  'Carol': 'from-emerald-500 to-teal-500',
+  'David': 'from-purple-500 to-pink-500',
+};
+
+const LEVEL_ICONS: Record<string, string> = {
+  'Alice': '🏅',
+  'Bob': '⚡',
+  'Carol': '📖',
+  'David': '👑',
+};
+
 export default function Login() {
   const [isRegister, setIsRegister] = useState(false);
   const [username, setUsername] = useState('');
@@ -68,20 +84,6 @@ export default function Login() {
     toast.success('Demo data has been reset');
   };
 
-  const levelColors: Record<string, string> = {
-    'Alice': 'from-blue-500 to-cyan-500',
-    'Bob': 'from-amber-500 to-orange-500',
-    'Carol': 'from-emerald-500 to-teal-500',
-    'David': 'from-purple-500 to-pink-500',
-  };
-
-  const levelIcons: Record<string, string> = {
-    'Alice': '🏅',
-    'Bob': '⚡',
-    'Carol': '📖',
-    'David': '👑',
-  };
-
   return (
     <div className="min-h-screen flex items-center justify-center p-4 relative overflow-hidden">
       {/* Background decoration */}
@@ -269,8 +271,8 @@ export default function Login() {
                   className="text-left p-4 rounded-xl bg-white/60 backdrop-blur border border-white/50 hover:border-blue-300 hover:shadow-lg hover:shadow-blue-500/10 transition-all group"
                 >
                   <div className="flex items-center gap-2 mb-2">
-                    <div className={`w-9 h-9 rounded-xl bg-gradient-to-br ${levelColors[account.username] || 'from-blue-500 to-cyan-500'} flex items-center justify-center text-lg`}>
-                      {levelIcons[account.username] || '🎓'}
+                    <div className={`w-9 h-9 rounded-xl bg-gradient-to-br ${LEVEL_COLORS[account.username] || 'from-blue-500 to-cyan-500'} flex items-center justify-center text-lg`}>
+                      {LEVEL_ICONS[account.username] || '🎓'}
                     </div>
                     <div>
                       <p className="text-sm font-bold text-foreground group-hover:text-blue-600 transition-colors">{account.username}</p>
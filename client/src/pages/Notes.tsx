@@ -1,7 +1,7 @@
 import { useState } from 'react';
 import { useAuth } from '@/contexts/AuthContext';
 import { GlassCard } from '@/components/GlassCard';
-import { getUserProfile, addGeneralNote, deleteGeneralNote, addConceptNote } from '@/lib/store';
+import { addGeneralNote, deleteGeneralNote, addConceptNote } from '@/lib/store';
 import { CONCEPTS } from '@/lib/questions';
 import { motion, AnimatePresence } from 'framer-motion';
 import { NotebookPen, Plus, Trash2, Tag, Clock, BookOpen, ChevronDown, ChevronUp } from 'lucide-react';
@@ -9,7 +9,9 @@ import { toast } from 'sonner';
 import { cn } from '@/lib/utils';
 
 export default function Notes() {
-  const { user, refreshProfile } = useAuth();
+  // Notes are listed from the context profile; the add/delete helpers below
+  // write through the store and call refreshProfile() to pick up the change.
+  const { user, profile, refreshProfile } = useAuth();
   const [activeTab, setActiveTab] = useState<'general' | 'concept'>('general');
   const [showAddForm, setShowAddForm] = useState(false);
   const [newTitle, setNewTitle] = useState('');
@@ -19,7 +21,6 @@ export default function Notes() {
   const [conceptNoteText, setConceptNoteText] = useState('');
   const [expandedIndex, setExpandedIndex] = useState<number | null>(null);
 
-  const profile = user ? getUserProfile(user) : null;
   if (!profile || !user) return null;
 
   const handleAddGeneral = () => {
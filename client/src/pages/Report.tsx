@@ -1,12 +1,11 @@
+import { useMemo } from 'react';
 import { useAuth } from '@/contexts/AuthContext';
 import { GlassCard, StatCard } from '@/components/GlassCard';
-import { generateReport, getLevelInfo } from '@/lib/store';
-import { motion } from 'framer-motion';
+import { buildReport } from '@/lib/store';
 import {
   FileText, Target, BookOpen, Flame, Star, TrendingUp, TrendingDown,
-  AlertCircle, CheckCircle2, Brain, Lightbulb, Download
+  AlertCircle, Brain, Lightbulb, Download
 } from 'lucide-react';
-import { cn } from '@/lib/utils';
 import { Button } from '@/components/ui/button';
 import {
   BarChart, Bar, XAxis, YAxis, ResponsiveContainer, Tooltip, CartesianGrid,
@@ -20,26 +19,32 @@ import {
 const COLORS = ['#3B82F6', '#60A5FA', '#93C5FD', '#BFDBFE', '#DBEAFE', '#06B6D4', '#10B981', '#F59E0B', '#EF4444', '#8B5CF6'];
 
 export default function Report() {
-  const { user } = useAuth();
-  if (!user) return null;
+  const { user, profile } = useAuth();
 
-  const report = generateReport(user);
-  if (!report) return null;
+  // Built from the context profile, so it is recomputed only when
+  // refreshProfile() loads new data rather than re-reading the store.
+  // Both charts are derived from the breakdown in the same memo and pass.
+  const built = useMemo(() => {
+    if (!profile) return null;
+    const report = buildReport(profile);
+    const barData: { concept: string; accuracy: number; total: number; fullName: string }[] = [];
+    const pieData: { name: string; value: number }[] = [];
+    for (const c of report.conceptBreakdown) {
+      barData.push({
+        concept: c.concept.length > 10 ? c.concept.slice(0, 8) + '…' : c.concept,
+        accuracy: c.accuracy,
+        total: c.total,
+        fullName: c.concept,
+      });
+      if (c.total > 0) pieData.push({ name: c.concept, value: c.total });
+    }
+    return { report, barData, pieData };
+  }, [profile]);
+  if (!user || !built) return null;
 
+  const { report, barData, pieData } = built;
   const { overview, conceptBreakdown, strengths, weaknesses, recommendations, xp, level, streak, wrongQuestionCount } = report;
 
-  const barData = conceptBreakdown.map(c => ({
-    concept: c.concept.length > 10 ? c.concept.slice(0, 8) + '…' : c.concept,
-    accuracy: c.accuracy,
-    total: c.total,
-    fullName: c.concept,
-  }));
-
-  const pieData = conceptBreakdown.filter(c => c.total > 0).map(c => ({
-    name: c.concept,
-    value: c.total,
-  }));
-
   if (overview.totalQuestions === 0) {
     return (
       <div className="space-y-5 max-w-4xl mx-auto">
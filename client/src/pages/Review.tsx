@@ -4,7 +4,7 @@ import { GlassCard, StatCard } from '@/components/GlassCard';
 import { getDueReviews, recordReview, getReviewStats } from '@/lib/store';
 import { getQuestionById } from '@/lib/questions';
 import { motion, AnimatePresence } from 'framer-motion';
-import { RefreshCw, Calendar, Brain, CheckCircle2, XCircle, ArrowRight, BarChart3 } from 'lucide-react';
+import { RefreshCw, Calendar, Brain, CheckCircle2, XCircle, BarChart3 } from 'lucide-react';
 import { toast } from 'sonner';
 import { cn } from '@/lib/utils';
 import { BarChart, Bar, XAxis, YAxis, ResponsiveContainer, Tooltip, CartesianGrid } from 'recharts';
@@ -7,16 +7,19 @@ import { Settings as SettingsIcon, Target, Save, Trash2, AlertTriangle } from 'l
 import { toast } from 'sonner';
 
 export default function Settings() {
-  const { user, refreshProfile, logout } = useAuth();
-  const profile = user ? getUserProfile(user) : null;
+  // The form shows the context profile; handleSave() re-reads the stored one
+  // so the write starts from the latest data rather than this snapshot.
+  const { user, profile, refreshProfile, logout } = useAuth();
   const [dailyGoal, setDailyGoal] = useState(profile?.dailyGoal || 10);
   const [showReset, setShowReset] = useState(false);
 
   if (!profile || !user) return null;
 
   const handleSave = () => {
-    profile.dailyGoal = dailyGoal;
-    saveUserProfile(profile);
+    const stored = getUserProfile(user);
+    if (!stored) return;
+    stored.dailyGoal = dailyGoal;
+    saveUserProfile(stored);
     refreshProfile();
     toast.success('Settings saved');
   };
@@ -1,60 +1,183 @@
-import { useState } from 'react';
+import { useState, useMemo, useCallback, memo } from 'react';
 import { useAuth } from '@/contexts/AuthContext';
 import { GlassCard } from '@/components/GlassCard';
-import { getUserProfile, saveUserProfile, addToReview } from '@/lib/store';
+import { getUserProfile, saveUserProfile, addToReview, countUnmasteredWrongQuestions, WrongQuestion } from '@/lib/store';
 import { questions, CONCEPTS } from '@/lib/questions';
 import { motion, AnimatePresence } from 'framer-motion';
-import { BookX, Filter, CheckCircle2, RotateCcw, ChevronDown, ChevronUp, Trash2, Search } from 'lucide-react';
+import { BookX, Filter, CheckCircle2, RotateCcw, ChevronDown, ChevronUp, ChevronLeft, ChevronRight, Trash2, Search } from 'lucide-react';
 import { toast } from 'sonner';
 import { cn } from '@/lib/utils';
 
+// Cards rendered per page; every card is an animated motion.div, so a long
+// history would otherwise mount hundreds of them at once.
+const PAGE_SIZE = 20;
+
+interface WrongQuestionCardProps {
+  wq: WrongQuestion;
+  isExpanded: boolean;
+  onToggle: (questionId: number) => void;
+  onMarkMastered: (questionId: number) => void;
+  onAddToReview: (questionId: number) => void;
+  onDelete: (questionId: number) => void;
+}
+
+// Memoized so that expanding one row, or typing in the search box, only
+// re-renders the rows whose props actually changed.
+const WrongQuestionCard = memo(function WrongQuestionCard({
+  wq, isExpanded, onToggle, onMarkMastered, onAddToReview, onDelete,
+}: WrongQuestionCardProps) {
+  return (
+    <motion.div
+      layout
+      initial={{ opacity: 0, y: 10 }}
+      animate={{ opacity: 1, y: 0 }}
+    >
+      <GlassCard hover={false} className="p-0 overflow-hidden">
+        <button
+          onClick={() => onToggle(wq.questionId)}
+          className="w-full text-left p-4 flex items-start gap-3"
+        >
+          <div className={cn(
+            'w-8 h-8 rounded-lg flex items-center justify-center shrink-0 text-xs font-bold',
+            wq.mastered ? 'bg-emerald-100 text-emerald-600' : 'bg-red-100 text-red-600'
+          )}>
+            {wq.mastered ? <CheckCircle2 size={14} /> : wq.wrongCount}
+          </div>
+          <div className="flex-1 min-w-0">
+            <p className="text-sm font-medium text-foreground line-clamp-2">{wq.question}</p>
+            <div className="flex items-center gap-2 mt-1.5">
+              <span className="text-[10px] px-2 py-0.5 rounded bg-blue-50 text-blue-600">{wq.concept}</span>
+              <span className="text-[10px] text-muted-foreground">Wrong {wq.wrongCount}x</span>
+              <span className="text-[10px] text-muted-foreground">
+                {new Date(wq.lastWrongTime).toLocaleDateString('en-US', { month: 'short', day: 'numeric' })}
+              </span>
+            </div>
+          </div>
+          {isExpanded ? <ChevronUp size={16} className="text-muted-foreground shrink-0 mt-1" /> : <ChevronDown size={16} className="text-muted-foreground shrink-0 mt-1" />}
+        </button>
+
+        <AnimatePresence>
+          {isExpanded && (
+            <motion.div
+              initial={{ height: 0 }}
+              animate={{ height: 'auto' }}
+              exit={{ height: 0 }}
+              className="overflow-hidden"
+            >
+              <div className="px-4 pb-4 space-y-3 border-t border-white/60 pt-3">
+                <div className="text-xs space-y-1">
+                  <p><span className="text-red-500 font-medium">Your Answer: </span>{wq.userAnswer}</p>
+                  <p><span className="text-emerald-500 font-medium">Correct Answer: </span>{wq.correctAnswer}</p>
+                </div>
+                <div className="p-3 rounded-lg bg-blue-50/50 text-xs text-blue-700">
+                  <strong>Explanation: </strong>{wq.explanation}
+                </div>
+                {wq.hint && (
+                  <div className="p-3 rounded-lg bg-amber-50/50 text-xs text-amber-700">
+                    <strong>Hint: </strong>{wq.hint}
+                  </div>
+                )}
+                <div className="flex gap-2 flex-wrap">
+                  {!wq.mastered && (
+                    <button
+                      onClick={() => onMarkMastered(wq.questionId)}
+                      className="px-3 py-1.5 rounded-lg bg-emerald-50 text-emerald-600 text-xs font-medium hover:bg-emerald-100 transition-colors flex items-center gap-1"
+                    >
+                      <CheckCircle2 size={12} /> Mark Mastered
+                    </button>
+                  )}
+                  <button
+                    onClick={() => onAddToReview(wq.questionId)}
+                    className="px-3 py-1.5 rounded-lg bg-blue-50 text-blue-600 text-xs font-medium hover:bg-blue-100 transition-colors flex items-center gap-1"
+                  >
+                    <RotateCcw size={12} /> Add to Review
+                  </button>
+                  <button
+                    onClick={() => onDelete(wq.questionId)}
+                    className="px-3 py-1.5 rounded-lg bg-red-50 text-red-600 text-xs font-medium hover:bg-red-100 transition-colors flex items-center gap-1"
+                  >
+                    <Trash2 size={12} /> Delete
+                  </button>
+                </div>
+              </div>
+            </motion.div>
+          )}
+        </AnimatePresence>
+      </GlassCard>
+    </motion.div>
+  );
+});
+
 export default function WrongQuestions() {
-  const { user, refreshProfile } = useAuth();
+  const { user, profile, refreshProfile } = useAuth();
   const [filterConcept, setFilterConcept] = useState('all');
   const [filterStatus, setFilterStatus] = useState<'all' | 'unmastered' | 'mastered'>('unmastered');
   const [expandedId, setExpandedId] = useState<number | null>(null);
   const [searchQuery, setSearchQuery] = useState('');
+  const [page, setPage] = useState(0);
 
-  const profile = user ? getUserProfile(user) : null;
-  if (!profile) return null;
-
-  let wrongList = [...profile.wrongQuestions];
-  if (filterConcept !== 'all') wrongList = wrongList.filter(w => w.concept === filterConcept);
-  if (filterStatus === 'unmastered') wrongList = wrongList.filter(w => !w.mastered);
-  else if (filterStatus === 'mastered') wrongList = wrongList.filter(w => w.mastered);
-  if (searchQuery) {
+  // Filter in one pass, then sort newest first. lastWrongTime always comes
+  // from toISOString(), so the strings order chronologically as they are.
+  // Memoized so unrelated state such as the expanded row doesn't redo it.
+  const wrongList = useMemo(() => {
+    if (!profile) return [];
     const q = searchQuery.toLowerCase();
-    wrongList = wrongList.filter(w => w.question.toLowerCase().includes(q) || w.concept.toLowerCase().includes(q));
-  }
-  wrongList.sort((a, b) => new Date(b.lastWrongTime).getTime() - new Date(a.lastWrongTime).getTime());
+    const list: WrongQuestion[] = [];
+    for (const w of profile.wrongQuestions) {
+      if (filterConcept !== 'all' && w.concept !== filterConcept) continue;
+      if (filterStatus === 'unmastered' && w.mastered) continue;
+      if (filterStatus === 'mastered' && !w.mastered) continue;
+      if (q && !w.question.toLowerCase().includes(q) && !w.concept.toLowerCase().includes(q)) continue;
+      list.push(w);
+    }
+    list.sort((a, b) => (a.lastWrongTime < b.lastWrongTime ? 1 : a.lastWrongTime > b.lastWrongTime ? -1 : 0));
+    return list;
+  }, [profile, filterConcept, filterStatus, searchQuery]);
 
-  const handleMarkMastered = (questionId: number) => {
-    const wq = profile.wrongQuestions.find(w => w.questionId === questionId);
-    if (wq) {
+  const handleToggle = useCallback((questionId: number) => {
+    setExpandedId(prev => (prev === questionId ? null : questionId));
+  }, []);
+
+  const handleMarkMastered = useCallback((questionId: number) => {
+    if (!user) return;
+    const stored = getUserProfile(user);
+    const wq = stored?.wrongQuestions.find(w => w.questionId === questionId);
+    if (stored && wq) {
       wq.mastered = true;
       wq.masteredTime = new Date().toISOString();
-      saveUserProfile(profile);
+      saveUserProfile(stored);
       refreshProfile();
       toast.success('Marked as mastered');
     }
-  };
+  }, [user, refreshProfile]);
 
-  const handleAddToReview = (questionId: number) => {
-    if (user) {
-      addToReview(user, questionId);
-      toast.success('Added to spaced review');
-    }
-  };
+  const handleAddToReview = useCallback((questionId: number) => {
+    if (!user) return;
+    addToReview(user, questionId);
+    toast.success('Added to spaced review');
+  }, [user]);
 
-  const handleDelete = (questionId: number) => {
-    profile.wrongQuestions = profile.wrongQuestions.filter(w => w.questionId !== questionId);
-    saveUserProfile(profile);
+  const handleDelete = useCallback((questionId: number) => {
+    if (!user) return;
+    const stored = getUserProfile(user);
+    if (!stored) return;
+    stored.wrongQuestions = stored.wrongQuestions.filter(w => w.questionId !== questionId);
+    saveUserProfile(stored);
     refreshProfile();
     toast.success('Deleted');
-  };
+  }, [user, refreshProfile]);
 
-  const unmasteredCount = profile.wrongQuestions.filter(w => !w.mastered).length;
-  const masteredCount = profile.wrongQuestions.filter(w => w.mastered).length;
+  // Render from the context profile: its identity only changes when
+  // refreshProfile() runs after one of the writes above, so wrongList stays
+  // memoised across keystrokes, whereas every store read returns a new copy.
+  if (!profile || !user) return null;
+
+  const pageCount = Math.max(1, Math.ceil(wrongList.length / PAGE_SIZE));
+  const currentPage = Math.min(page, pageCount - 1);
+  const visibleList = wrongList.slice(currentPage * PAGE_SIZE, (currentPage + 1) * PAGE_SIZE);
+
+  const unmasteredCount = countUnmasteredWrongQuestions(profile);
+  const masteredCount = profile.wrongQuestions.length - unmasteredCount;
 
   return (
     <div className="space-y-5 max-w-4xl mx-auto">
@@ -77,13 +200,13 @@ export default function WrongQuestions() {
               type="text"
               placeholder="Search questions..."
               value={searchQuery}
-              onChange={e => setSearchQuery(e.target.value)}
+              onChange={e => { setSearchQuery(e.target.value); setPage(0); }}
               className="w-full pl-9 pr-3 py-2 rounded-lg bg-white/60 border border-white/80 text-xs focus:outline-none focus:ring-2 focus:ring-blue-500/30"
             />
           </div>
           <select
             value={filterConcept}
-            onChange={e => setFilterConcept(e.target.value)}
+            onChange={e => { setFilterConcept(e.target.value); setPage(0); }}
             className="text-xs bg-white/60 border border-white/80 rounded-lg px-3 py-2 focus:outline-none focus:ring-2 focus:ring-blue-500/30"
           >
             <option value="all">All Concepts</option>
@@ -93,7 +216,7 @@ export default function WrongQuestions() {
             {(['all', 'unmastered', 'mastered'] as const).map(s => (
               <button
                 key={s}
-                onClick={() => setFilterStatus(s)}
+                onClick={() => { setFilterStatus(s); setPage(0); }}
                 className={cn(
                   'px-3 py-1.5 rounded-lg text-xs font-medium transition-all',
                   filterStatus === s ? 'bg-blue-500 text-white' : 'bg-white/60 text-muted-foreground hover:bg-blue-50'
@@ -116,90 +239,38 @@ export default function WrongQuestions() {
         </GlassCard>
       ) : (
         <div className="space-y-3">
-          {wrongList.map((wq) => {
-            const isExpanded = expandedId === wq.questionId;
-            return (
-              <motion.div
-                key={wq.questionId}
-                layout
-                initial={{ opacity: 0, y: 10 }}
-                animate={{ opacity: 1, y: 0 }}
+          {visibleList.map(wq => (
+            <WrongQuestionCard
+              key={wq.questionId}
+              wq={wq}
+              isExpanded={expandedId === wq.questionId}
+              onToggle={handleToggle}
+              onMarkMastered={handleMarkMastered}
+              onAddToReview={handleAddToReview}
+              onDelete={handleDelete}
+            />
+          ))}
+          {pageCount > 1 && (
+            <div className="flex items-center justify-center gap-3 pt-1">
+              <button
+                onClick={() => setPage(currentPage - 1)}
+                disabled={currentPage === 0}
+                className="p-1.5 rounded-lg bg-white/60 text-muted-foreground hover:bg-blue-50 transition-all disabled:opacity-40 disabled:pointer-events-none"
               >
-                <GlassCard hover={false} className="p-0 overflow-hidden">
-                  <button
-                    onClick={() => setExpandedId(isExpanded ? null : wq.questionId)}
-                    className="w-full text-left p-4 flex items-start gap-3"
-                  >
-                    <div className={cn(
-                      'w-8 h-8 rounded-lg flex items-center justify-center shrink-0 text-xs font-bold',
-                      wq.mastered ? 'bg-emerald-100 text-emerald-600' : 'bg-red-100 text-red-600'
-                    )}>
-                      {wq.mastered ? <CheckCircle2 size={14} /> : wq.wrongCount}
-                    </div>
-                    <div className="flex-1 min-w-0">
-                      <p className="text-sm font-medium text-foreground line-clamp-2">{wq.question}</p>
-                      <div className="flex items-center gap-2 mt-1.5">
-                        <span className="text-[10px] px-2 py-0.5 rounded bg-blue-50 text-blue-600">{wq.concept}</span>
-                        <span className="text-[10px] text-muted-foreground">Wrong {wq.wrongCount}x</span>
-                        <span className="text-[10px] text-muted-foreground">
-                          {new Date(wq.lastWrongTime).toLocaleDateString('en-US', { month: 'short', day: 'numeric' })}
-                        </span>
-                      </div>
-                    </div>
-                    {isExpanded ? <ChevronUp size={16} className="text-muted-foreground shrink-0 mt-1" /> : <ChevronDown size={16} className="text-muted-foreground shrink-0 mt-1" />}
-                  </button>
-
-                  <AnimatePresence>
-                    {isExpanded && (
-                      <motion.div
-                        initial={{ height: 0 }}
-                        animate={{ height: 'auto' }}
-                        exit={{ height: 0 }}
-                        className="overflow-hidden"
-                      >
-                        <div className="px-4 pb-4 space-y-3 border-t border-white/60 pt-3">
-                          <div className="text-xs space-y-1">
-                            <p><span className="text-red-500 font-medium">Your Answer: </span>{wq.userAnswer}</p>
-                            <p><span className="text-emerald-500 font-medium">Correct Answer: </span>{wq.correctAnswer}</p>
-                          </div>
-                          <div className="p-3 rounded-lg bg-blue-50/50 text-xs text-blue-700">
-                            <strong>Explanation: </strong>{wq.explanation}
-                          </div>
-                          {wq.hint && (
-                            <div className="p-3 rounded-lg bg-amber-50/50 text-xs text-amber-700">
-                              <strong>Hint: </strong>{wq.hint}
-                            </div>
-                          )}
-                          <div className="flex gap-2 flex-wrap">
-                            {!wq.mastered && (
-                              <button
-                                onClick={() => handleMarkMastered(wq.questionId)}
-                                className="px-3 py-1.5 rounded-lg bg-emerald-50 text-emerald-600 text-xs font-medium hover:bg-emerald-100 transition-colors flex items-center gap-1"
-                              >
-                                <CheckCircle2 size={12} /> Mark Mastered
-                              </button>
-                            )}
-                            <button
-                              onClick={() => handleAddToReview(wq.questionId)}
-                              className="px-3 py-1.5 rounded-lg bg-blue-50 text-blue-600 text-xs font-medium hover:bg-blue-100 transition-colors flex items-center gap-1"
-                            >
-                              <RotateCcw size={12} /> Add to Review
-                            </button>
-                            <button
-                              onClick={() => handleDelete(wq.questionId)}
-                              className="px-3 py-1.5 rounded-lg bg-red-50 text-red-600 text-xs font-medium hover:bg-red-100 transition-colors flex items-center gap-1"
-                            >
-                              <Trash2 size={12} /> Delete
-                            </button>
-                          </div>
-                        </div>
-                      </motion.div>
-                    )}
-                  </AnimatePresence>
-                </GlassCard>
-              </motion.div>
-            );
-          })}
+                <ChevronLeft size={14} />
+              </button>
+              <span className="text-xs text-muted-foreground">
+                Page {currentPage + 1} of {pageCount}
+              </span>
+              <button
+                onClick={() => setPage(currentPage + 1)}
+                disabled={currentPage === pageCount - 1}
+                className="p-1.5 rounded-lg bg-white/60 text-muted-foreground hover:bg-blue-50 transition-all disabled:opacity-40 disabled:pointer-events-none"
+              >
+                <ChevronRight size={14} />
+              </button>
+            </div>
+          )}
         </div>
       )}
     </div>